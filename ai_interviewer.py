@@ -5,38 +5,28 @@ This module handles the conversational AI logic, interview management,
 and interaction with the language model.
 """
 
+import os
 import logging
-from typing import Tuple, List, Optional
+import orjson
+import functools
+from typing import Any, AsyncIterator, ClassVar, Dict, Final, Iterator, Tuple, List, Optional
 from langchain_openai import ChatOpenAI
-from langchain.chains import ConversationChain
-from langchain.memory import ConversationBufferMemory
-from langchain.prompts import PromptTemplate
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.outputs import LLMResult
 
 from config import Config
 from models import InterviewSession, ConversationRole
+from llm_cache import LLMCache, SQLiteBackend
+from circuit_breaker import OPENAI_CIRCUIT_BREAKER
+from http_pool import get_http_client
+from tokenizer import count_tokens
 
 logger = logging.getLogger(__name__)
 
-class AIInterviewer:
-    """Handles AI-powered interview conversations"""
-    
-    def __init__(self):
-        """Initialize the AI interviewer with LangChain components"""
-        self.llm = ChatOpenAI(
-            model=Config.OPENAI_MODEL,
-            temperature=Config.OPENAI_TEMPERATURE,
-            api_key=Config.OPENAI_API_KEY
-        )
-        self.conversation_chain = self._create_conversation_chain()
-        self.current_session: Optional[InterviewSession] = None
-    
-    def _create_conversation_chain(self) -> ConversationChain:
-        """Create and configure the LangChain ConversationChain for the interviewer"""
-        
-        # Custom prompt template for the interviewer
-        interviewer_prompt = PromptTemplate(
-            input_variables=["history", "input"],
-            template="""You are a professional, neutral, and curious researcher conducting an alignment interview. 
+# Static interviewer instructions. Kept as the first message of every request so
+# the provider can serve this prefix from its prompt cache.
+INTERVIEWER_SYSTEM_PROMPT: Final[str] = """You are a professional, neutral, and curious researcher conducting an alignment interview. 
 
 Guidelines:
 - Be professional, warm, and genuinely curious
@@ -44,48 +34,150 @@ Guidelines:
 - Don't be leading or judgmental
 - If the employee gives a brief answer, gently probe for more details
 - Focus on understanding their perspective, concerns, and ideas
-- Keep responses concise but engaging
+- Keep responses concise but engaging"""
 
-Current conversation:
-{history}
-Human: {input}
-Assistant:"""
-        )
-        
-        # Create memory for conversation context
-        memory = ConversationBufferMemory(human_prefix="Human", ai_prefix="Assistant")
+# One message object shared by every session, so every request starts with the
+# same bytes; OpenAI caches byte-identical prompt prefixes automatically, without
+# any hint. Its token count is memoized by _count_text_tokens on first use, so
+# budget checks never re-encode it
+INTERVIEWER_SYSTEM_MESSAGE: Final[SystemMessage] = SystemMessage(content=INTERVIEWER_SYSTEM_PROMPT)
+
+BATCH_SYSTEM_PROMPT = INTERVIEWER_SYSTEM_PROMPT + """
+
+You will receive a JSON array of interviews. Each interview is an array of the employee's answers, in order.
+For each element of the input JSON array, produce an interviewer follow-up for every answer, as if replying to it in sequence.
+Return only a JSON array of the same length, where each element is an array of follow-up strings matching that interview's answers."""
+
+SPECULATION_PROMPT = """Predict the employee's most likely reply to your last question, written in their voice.
+Respond with the reply only."""
+
+CONTEXT_TOO_LONG_ERROR = "Your message is too long for the interview context. Please shorten it and try again."
+
+@functools.lru_cache(maxsize=4096)
+def _count_text_tokens(model: str, text: str) -> int:
+    """Count the tokens of a text once; history messages are re-counted on every turn"""
+    return count_tokens(model, text)
+
+def _count_tokens(messages: List[BaseMessage]) -> int:
+    """Count the content tokens of the given messages with the interview model's tokenizer"""
+    return sum(_count_text_tokens(Config.INTERVIEW_MODEL, message.content) for message in messages)
+
+class PromptCacheTracker(BaseCallbackHandler):
+    """Records how many prompt tokens of the last LLM call were served from cache"""
+    
+    def __init__(self):
+        self.cached_tokens = 0
+    
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        """Read cached prompt tokens from the response usage metadata"""
+        self.cached_tokens = 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+                self.cached_tokens += usage.get("input_token_details", {}).get("cache_read", 0)
+
+class AIInterviewer:
+    """Handles AI-powered interview conversations"""
+    
+    # Model clients shared by every interviewer built without its own, keyed by
+    # the settings they were built with
+    _shared_llms: ClassVar[Dict[Tuple[str, float, Optional[str]], ChatOpenAI]] = {}
+    
+    def __init__(self, llm: Optional[ChatOpenAI] = None, http_async_client: Optional[Any] = None):
+        """
+        Initialize the AI interviewer with LangChain components
         
-        # Create the conversation chain
-        chain = ConversationChain(
-            llm=self.llm,
-            memory=memory,
-            prompt=interviewer_prompt,
-            verbose=False
+        Args:
+            llm: Optional model to share with other interviewers, so concurrent
+                interviews reuse one client and its connection pool
+            http_async_client: Optional httpx.AsyncClient for the model's async
+                calls; ignored when llm is given. Without either, the interviewer
+                uses the client shared across instances
+        """
+        if llm is None and http_async_client is not None:
+            llm = self._build_llm(http_async_client)
+        self.llm = llm or self._get_shared_llm()
+        # Built per session in start_session and released in end_session: the
+        # static prefix is never mutated, the history after it is append-only
+        self._static_prefix_messages: Tuple[BaseMessage, ...] = ()
+        self.history: List[BaseMessage] = []
+        self.current_session: Optional[InterviewSession] = None
+        self._cache_tracker = PromptCacheTracker()
+        self._cache_hits = 0
+        self._response_cache: Optional[LLMCache] = None
+        if Config.RESPONSE_CACHE_ENABLED:
+            Config.create_directories()
+            self._response_cache = LLMCache(
+                SQLiteBackend(
+                    os.path.join(Config.CONVERSATIONS_DIR, ".cache.sqlite"),
+                    max_age_seconds=Config.RESPONSE_CACHE_TTL_SECONDS
+                ),
+                ttl_seconds=Config.RESPONSE_CACHE_TTL_SECONDS
+            )
+    
+    @staticmethod
+    def _build_llm(http_async_client: Optional[Any] = None) -> ChatOpenAI:
+        """Build the interview model client from the current configuration"""
+        return ChatOpenAI(
+            model=Config.INTERVIEW_MODEL,
+            temperature=0 if Config.RESPONSE_CACHE_ENABLED else Config.OPENAI_TEMPERATURE,
+            api_key=Config.OPENAI_API_KEY,
+            stream_usage=True,
+            http_client=get_http_client(),
+            http_async_client=http_async_client,
+            # The SDK retries timeouts, 429s and 5xx with jittered exponential backoff
+            timeout=Config.OPENAI_REQUEST_TIMEOUT,
+            max_retries=Config.OPENAI_MAX_RETRIES,
+            callbacks=[OPENAI_CIRCUIT_BREAKER]
         )
-        
-        return chain
+    
+    @classmethod
+    def _get_shared_llm(cls) -> ChatOpenAI:
+        """Get the model client shared by interviewers, building it on first use"""
+        key = (
+            Config.INTERVIEW_MODEL,
+            0 if Config.RESPONSE_CACHE_ENABLED else Config.OPENAI_TEMPERATURE,
+            Config.OPENAI_API_KEY
+        )
+        if key not in cls._shared_llms:
+            cls._shared_llms[key] = cls._build_llm()
+        return cls._shared_llms[key]
+    
+    @classmethod
+    def reset_shared_clients(cls) -> None:
+        """Drop the shared model clients so the next interviewer builds a fresh one"""
+        cls._shared_llms.clear()
     
     def start_session(self, topic: str) -> InterviewSession:
         """Start a new interview session with the given topic"""
-        if not topic.strip():
+        topic = topic.strip()
+        if not topic:
             raise ValueError("Topic cannot be empty")
         
         # Create new session
         self.current_session = InterviewSession(
-            topic=topic.strip(),
+            topic=topic,
             max_turns=Config.MAX_INTERVIEW_TURNS,
             is_active=True
         )
         
         # Generate initial question
-        initial_question = self._generate_initial_question(topic)
+        initial_question = self.generate_initial_question(topic)
         self.current_session.add_turn(ConversationRole.ASSISTANT, initial_question)
         
+        # System prompt and topic framing form a byte-identical prefix for every
+        # request of the session; OpenAI caches such prefixes automatically, with no hint
+        self._static_prefix_messages = (
+            INTERVIEWER_SYSTEM_MESSAGE,
+            HumanMessage(content=f"Topic: {topic}")
+        )
+        self.history = [AIMessage(content=initial_question)]
+        
         logger.info(f"Started new interview session with topic: {topic}")
         return self.current_session
     
-    def _generate_initial_question(self, topic: str) -> str:
-        """Generate the initial question for the interview"""
+    def generate_initial_question(self, topic: str) -> str:
+        """Generate the opening question of an interview on the topic"""
         return f"""Thank you for participating in our alignment session. We're focusing on: '{topic}'. 
 
 To get started, could you share your initial thoughts on this topic? What does it mean to you, and what aspects are most important from your perspective?"""
@@ -104,13 +196,30 @@ To get started, could you share your initial thoughts on this topic? What does i
             return "", True, "Interview is already complete"
         
         try:
+            # Check the context budget before the turn is recorded
+            messages = self._fit_context(user_message)
+            if messages is None:
+                return "", False, CONTEXT_TOO_LONG_ERROR
+            
+            cache_key = self._response_cache_key(user_message)
+            
             # Add user message to session
             self.current_session.add_turn(ConversationRole.USER, user_message)
             
-            # Generate AI response
-            ai_response = self.conversation_chain.predict(
-                input=user_message
-            )
+            ai_response = self._get_cached_response(cache_key, user_message)
+            if ai_response is None:
+                # Generate AI response
+                response = self.llm.invoke(messages, config={"callbacks": [self._cache_tracker]})
+                ai_response = response.content
+                
+                if self._cache_tracker.cached_tokens:
+                    self._cache_hits += 1
+                logger.info(f"Prompt cache: {self._cache_tracker.cached_tokens} cached tokens "
+                            f"({self._cache_hits} cache hits this interviewer)")
+                
+                if cache_key is not None:
+                    self._response_cache.set(cache_key, ai_response)
+                self._append_history(user_message, ai_response)
             
             # Add AI response to session
             self.current_session.add_turn(ConversationRole.ASSISTANT, ai_response)
@@ -122,11 +231,314 @@ To get started, could you share your initial thoughts on this topic? What does i
                 logger.info("Interview completed")
             
             return ai_response, is_complete, None
-            
+        
         except Exception as e:
             logger.error(f"Error during interview: {e}")
             return "", False, f"An error occurred: {str(e)}"
     
+    def conduct_interview_stream(self, user_message: str) -> Iterator[str]:
+        """
+        Conduct the interview with the given user message, streaming the response
+        
+        The reply is streamed straight from the model; history and the session
+        transcript are updated once the stream completes.
+        
+        Yields:
+            Chunks of the AI response as they are generated
+        """
+        if not self.current_session or not self.current_session.is_active:
+            raise RuntimeError("No active interview session")
+        
+        if self.current_session.is_complete():
+            raise RuntimeError("Interview is already complete")
+        
+        messages = self._fit_context(user_message)
+        if messages is None:
+            raise ValueError(CONTEXT_TOO_LONG_ERROR)
+        
+        cache_key = self._response_cache_key(user_message)
+        
+        # Add user message to session
+        self.current_session.add_turn(ConversationRole.USER, user_message)
+        
+        ai_response = self._get_cached_response(cache_key, user_message)
+        if ai_response is not None:
+            yield ai_response
+        else:
+            # Stream the AI response, keeping the full text for the transcript
+            chunks: List[str] = []
+            for chunk in self.llm.stream(messages, config={"callbacks": [self._cache_tracker]}):
+                if chunk.content:
+                    chunks.append(chunk.content)
+                    yield chunk.content
+            
+            ai_response = "".join(chunks)
+            if cache_key is not None:
+                self._response_cache.set(cache_key, ai_response)
+            self._append_history(user_message, ai_response)
+        
+        self.current_session.add_turn(ConversationRole.ASSISTANT, ai_response)
+        
+        if self.current_session.is_complete():
+            logger.info("Interview completed")
+    
+    async def aconduct_interview(self, user_message: str) -> AsyncIterator[str]:
+        """
+        Async counterpart of conduct_interview_stream
+        
+        Yields:
+            Chunks of the AI response as they are generated
+        """
+        if not self.current_session or not self.current_session.is_active:
+            raise RuntimeError("No active interview session")
+        
+        if self.current_session.is_complete():
+            raise RuntimeError("Interview is already complete")
+        
+        messages = await self._afit_context(user_message)
+        if messages is None:
+            raise ValueError(CONTEXT_TOO_LONG_ERROR)
+        
+        cache_key = self._response_cache_key(user_message)
+        
+        # Add user message to session
+        self.current_session.add_turn(ConversationRole.USER, user_message)
+        
+        ai_response = self._get_cached_response(cache_key, user_message)
+        if ai_response is not None:
+            yield ai_response
+        else:
+            # Stream the AI response, keeping the full text for the transcript
+            chunks: List[str] = []
+            async for chunk in self.llm.astream(messages, config={"callbacks": [self._cache_tracker]}):
+                if chunk.content:
+                    chunks.append(chunk.content)
+                    yield chunk.content
+            
+            ai_response = "".join(chunks)
+            if cache_key is not None:
+                self._response_cache.set(cache_key, ai_response)
+            self._append_history(user_message, ai_response)
+        
+        self.current_session.add_turn(ConversationRole.ASSISTANT, ai_response)
+        
+        if self.current_session.is_complete():
+            logger.info("Interview completed")
+    
+    async def apredict_next_turn(self) -> Optional[Tuple[str, str]]:
+        """
+        Draft the employee's likely next reply and the follow-up to it, without changing the session
+        
+        Returns:
+            Tuple of (predicted_reply, follow_up), or None if the session can't take another turn
+        """
+        if not self.current_session or not self.current_session.is_active or self.current_session.is_complete():
+            return None
+        
+        prediction = await self.llm.ainvoke([
+            *self._static_prefix_messages, *self.history, HumanMessage(content=SPECULATION_PROMPT)
+        ])
+        messages = self._build_messages(prediction.content)
+        if self._over_budget(messages):
+            return None
+        
+        follow_up = await self.llm.ainvoke(messages)
+        return prediction.content, follow_up.content
+    
+    def record_turn(self, user_message: str, ai_response: str) -> None:
+        """Record a turn whose reply was produced ahead of time, e.g. by a speculative prefetch"""
+        if not self.current_session or not self.current_session.is_active:
+            raise RuntimeError("No active interview session")
+        
+        if self.current_session.is_complete():
+            raise RuntimeError("Interview is already complete")
+        
+        self.current_session.add_turn(ConversationRole.USER, user_message)
+        self._append_history(user_message, ai_response)
+        self.current_session.add_turn(ConversationRole.ASSISTANT, ai_response)
+        
+        if self.current_session.is_complete():
+            logger.info("Interview completed")
+    
+    def _fit_context(self, user_message: str) -> Optional[List[BaseMessage]]:
+        """
+        Build the request messages, summarizing the oldest half of the history if they exceed the context budget
+        
+        If the summarized request still doesn't fit, the oldest history messages are dropped.
+        
+        Returns:
+            The messages to send, or None if they cannot fit even after summarizing
+        """
+        messages = self._build_messages(user_message)
+        if not self._over_budget(messages):
+            return messages
+        
+        older_count = len(self.history) // 2
+        if older_count:
+            summary = self.llm.invoke(self._summary_prompt(older_count), max_tokens=Config.MAX_OUTPUT_TOKENS)
+            self._replace_with_summary(older_count, summary.content)
+            messages = self._build_messages(user_message)
+            if not self._over_budget(messages):
+                return messages
+        
+        messages = self._evict_oldest(user_message)
+        if messages is None:
+            logger.warning("Interview request exceeds the context budget")
+        return messages
+    
+    async def _afit_context(self, user_message: str) -> Optional[List[BaseMessage]]:
+        """Async counterpart of _fit_context"""
+        messages = self._build_messages(user_message)
+        if not self._over_budget(messages):
+            return messages
+        
+        older_count = len(self.history) // 2
+        if older_count:
+            summary = await self.llm.ainvoke(self._summary_prompt(older_count), max_tokens=Config.MAX_OUTPUT_TOKENS)
+            self._replace_with_summary(older_count, summary.content)
+            messages = self._build_messages(user_message)
+            if not self._over_budget(messages):
+                return messages
+        
+        messages = self._evict_oldest(user_message)
+        if messages is None:
+            logger.warning("Interview request exceeds the context budget")
+        return messages
+    
+    def _evict_oldest(self, user_message: str) -> Optional[List[BaseMessage]]:
+        """Drop the fewest oldest history messages that make the request fit; the static prefix always stays"""
+        for dropped in range(1, len(self.history) + 1):
+            messages = [*self._static_prefix_messages, *self.history[dropped:], HumanMessage(content=user_message)]
+            if not self._over_budget(messages):
+                del self.history[:dropped]
+                logger.info(f"Evicted {dropped} history messages to fit the context budget")
+                return messages
+        return None
+    
+    @staticmethod
+    def _over_budget(messages: List[BaseMessage]) -> bool:
+        """Check whether the messages leave too little room for the reply"""
+        budget = Config.MAX_CONTEXT_TOKENS - Config.MAX_OUTPUT_TOKENS
+        
+        # A token spans at least one UTF-8 byte and a character at most four,
+        # so short prompts never need to be tokenized
+        if sum(len(message.content) for message in messages) * 4 <= budget:
+            return False
+        return _count_tokens(messages) > budget
+    
+    def _summary_prompt(self, older_count: int) -> str:
+        """Build the prompt that summarizes the oldest history messages"""
+        transcript = "\n".join(
+            f"{message.type}: {message.content}" for message in self.history[:older_count]
+        )
+        return ("Summarize the following part of an alignment interview, keeping every distinct point "
+                f"the employee raised:\n\n{transcript}")
+    
+    def _replace_with_summary(self, older_count: int, summary: str) -> None:
+        """Replace the oldest history messages with their summary"""
+        self.history[:older_count] = [SystemMessage(content=f"Summary of the earlier interview:\n{summary}")]
+    
+    def _build_messages(self, user_message: str) -> List[BaseMessage]:
+        """Build the request messages: static prefix, then history, then the new message"""
+        return [*self._static_prefix_messages, *self.history, HumanMessage(content=user_message)]
+    
+    def _append_history(self, user_message: str, ai_response: str) -> None:
+        """Record a completed turn, keeping at most MEMORY_MAX_MESSAGES after the static prefix"""
+        self.history.append(HumanMessage(content=user_message))
+        self.history.append(AIMessage(content=ai_response))
+        
+        if len(self.history) > Config.MEMORY_MAX_MESSAGES:
+            del self.history[:len(self.history) - Config.MEMORY_MAX_MESSAGES]
+    
+    def _response_cache_key(self, user_message: str) -> Optional[str]:
+        """Build the response cache key for the next turn, or None if caching is off"""
+        if self._response_cache is None:
+            return None
+        
+        return LLMCache.make_key({
+            "kind": "interview_response",
+            "model": self.llm.model_name,
+            "topic": self.current_session.topic,
+            "history": [(turn.role.value, turn.content) for turn in self.current_session.conversation],
+            "user_message": user_message
+        })
+    
+    def _get_cached_response(self, cache_key: Optional[str], user_message: str) -> Optional[str]:
+        """Look up a cached response and replay it into history on a hit"""
+        if cache_key is None:
+            return None
+        
+        ai_response = self._response_cache.get(cache_key)
+        if ai_response is not None:
+            # Keep history consistent with the transcript for later, uncached turns
+            self._append_history(user_message, ai_response)
+            logger.info("Served interviewer response from cache")
+        return ai_response
+    
+    def batch_conduct(self, scenarios: List[List[str]], topic: Optional[str] = None) -> List[List[str]]:
+        """
+        Generate interviewer follow-ups for several scripted interviews in a single request
+        
+        Args:
+            scenarios: One list of employee answers per interview
+            topic: Optional alignment topic the interviews are about
+        
+        Returns:
+            One list of follow-ups per interview, matched to the answers by index
+        """
+        if not scenarios:
+            return []
+        
+        followups = self._request_batch_followups(scenarios, topic)
+        if followups is not None:
+            return followups
+        
+        # Fall back to one request per interview if the combined reply could not be parsed
+        logger.warning("Batch reply could not be parsed, falling back to per-interview requests")
+        results = []
+        for scenario in scenarios:
+            scenario_followups = self._request_batch_followups([scenario], topic)
+            if scenario_followups is None:
+                raise ValueError("Could not parse interviewer follow-ups from the model reply")
+            results.extend(scenario_followups)
+        return results
+    
+    def _request_batch_followups(self, scenarios: List[List[str]], topic: Optional[str]) -> Optional[List[List[str]]]:
+        """Request follow-ups for the given interviews; returns None if the reply doesn't match"""
+        system_prompt = BATCH_SYSTEM_PROMPT
+        if topic:
+            system_prompt += f"\n\nThe alignment topic is: '{topic}'."
+        
+        response = self.llm.invoke([
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=orjson.dumps(scenarios).decode())
+        ])
+        
+        try:
+            followups = orjson.loads(self._strip_code_fence(response.content))
+        except orjson.JSONDecodeError:
+            return None
+        
+        # Results are matched by index, so the shape must mirror the input exactly
+        if not isinstance(followups, list) or len(followups) != len(scenarios):
+            return None
+        for answers, replies in zip(scenarios, followups):
+            if not isinstance(replies, list) or len(replies) != len(answers):
+                return None
+            if not all(isinstance(reply, str) for reply in replies):
+                return None
+        return followups
+    
+    @staticmethod
+    def _strip_code_fence(text: str) -> str:
+        """Remove a surrounding markdown code fence from a model reply"""
+        text = text.strip()
+        if text.startswith("```"):
+            text = text.split("\n", 1)[1] if "\n" in text else ""
+            if text.rstrip().endswith("```"):
+                text = text.rstrip()[:-3]
+        return text
+    
     def end_session(self) -> Optional[InterviewSession]:
         """End the current interview session"""
         if not self.current_session:
@@ -136,12 +548,33 @@ To get started, could you share your initial thoughts on this topic? What does i
         session = self.current_session
         self.current_session = None
         
-        # Clear conversation memory
-        self.conversation_chain.memory.clear()
+        # Drop the history so the session's messages can be reclaimed right away
+        self._static_prefix_messages = ()
+        self.history = []
         
         logger.info(f"Ended interview session for topic: {session.topic}")
         return session
     
+    def close(self) -> None:
+        """Release the conversation history and the response cache connection"""
+        self._static_prefix_messages = ()
+        self.history = []
+        if self._response_cache is not None:
+            self._response_cache.backend.close()
+            self._response_cache = None
+    
+    def __del__(self):
+        """Release held resources when the interviewer is garbage collected"""
+        # __init__ may have failed before the cache attribute was set
+        if getattr(self, "_response_cache", None) is not None:
+            self.close()
+    
+    def get_cache_statistics(self) -> dict:
+        """Get hit and miss counts of the response cache; empty when it is disabled"""
+        if self._response_cache is None:
+            return {}
+        return self._response_cache.get_statistics()
+    
     def get_current_session(self) -> Optional[InterviewSession]:
         """Get the current interview session"""
         return self.current_session
@@ -0,0 +1,105 @@
+"""
+Circuit Breaker module for Company Alignment Facilitator
+
+This module stops model calls from piling onto a degraded OpenAI API: after
+repeated transient failures, calls fail fast for a short cooldown instead of
+each waiting out its own timeout and retries.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List
+
+import openai
+from langchain_core.callbacks import BaseCallbackHandler
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Failures that outlasted the SDK's own retries and point at the service, not the request
+TRANSIENT_ERRORS = (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError)
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the model while the circuit is open"""
+
+class CircuitBreaker(BaseCallbackHandler):
+    """
+    Opens after too many transient model failures within a time window
+    
+    Attached as a callback to every model client, so it sees each call of
+    interviews, streams and summarization chains alike.
+    """
+    
+    # Let CircuitOpenError from on_chat_model_start abort the call, and check
+    # synchronously in async calls rather than on an executor thread
+    raise_error = True
+    run_inline = True
+    
+    def __init__(self, failure_threshold: int, window_seconds: float, cooldown_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.window_seconds = window_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.failures = 0
+        self.trips = 0
+        self.rejected = 0
+        self._recent_failures: Deque[float] = deque()
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+    
+    def check(self) -> None:
+        """Raise CircuitOpenError if calls are currently being refused"""
+        with self._lock:
+            remaining = self._open_until - time.monotonic()
+            if remaining > 0:
+                self.rejected += 1
+                raise CircuitOpenError(f"OpenAI API is failing; retry in {remaining:.1f}s")
+    
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[Any]], **kwargs: Any) -> None:
+        """Refuse the call while the circuit is open"""
+        self.check()
+    
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], **kwargs: Any) -> None:
+        """Refuse the call while the circuit is open"""
+        self.check()
+    
+    def on_llm_end(self, response: Any, **kwargs: Any) -> None:
+        """A successful call closes the failure streak"""
+        with self._lock:
+            self._recent_failures.clear()
+    
+    def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        """Count transient failures and open the circuit when they cluster"""
+        if not isinstance(error, TRANSIENT_ERRORS):
+            return
+        
+        now = time.monotonic()
+        with self._lock:
+            self.failures += 1
+            self._recent_failures.append(now)
+            while self._recent_failures[0] < now - self.window_seconds:
+                self._recent_failures.popleft()
+            
+            if len(self._recent_failures) >= self.failure_threshold:
+                self._open_until = now + self.cooldown_seconds
+                self._recent_failures.clear()
+                self.trips += 1
+                logger.warning(f"Opening circuit for {self.cooldown_seconds}s after "
+                               f"{self.failure_threshold} model failures")
+    
+    def get_statistics(self) -> dict:
+        """Get failure, trip and rejection counts"""
+        return {
+            "llm_failures": self.failures,
+            "circuit_breaker_trips": self.trips,
+            "circuit_breaker_rejections": self.rejected
+        }
+
+# Every model call goes to the same OpenAI API host, so one breaker guards them all
+OPENAI_CIRCUIT_BREAKER = CircuitBreaker(
+    failure_threshold=Config.CIRCUIT_BREAKER_FAILURES,
+    window_seconds=Config.CIRCUIT_BREAKER_WINDOW_SECONDS,
+    cooldown_seconds=Config.CIRCUIT_BREAKER_COOLDOWN_SECONDS
+)
\ No newline at end of file
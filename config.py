@@ -6,42 +6,108 @@ used throughout the application.
 """
 
 import os
+import functools
+from dataclasses import dataclass
 from typing import Optional
 
-class Config:
-    """Application configuration class"""
+# Environment is read once at import; Config attributes never re-enter os.getenv
+_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
+
+@functools.lru_cache(maxsize=None)
+def _validate_api_key(api_key: Optional[str]) -> bool:
+    """Validate an API key value; memoized per value so overrides stay correct"""
+    return bool(api_key)
+
+@dataclass(slots=True)
+class _Config:
+    """Application configuration; attributes are slots on the Config singleton"""
     
     # OpenAI Configuration
-    OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
-    OPENAI_MODEL: str = "gpt-4-turbo-preview"
+    OPENAI_API_KEY: Optional[str] = _API_KEY
+    # Interview turns are short open-ended probes; the report needs the large model
+    INTERVIEW_MODEL: str = "gpt-4o-mini"
+    REPORT_MODEL: str = "gpt-4-turbo-preview"
     OPENAI_TEMPERATURE: float = 0.7
     
+    # Service tier for report generation ("auto", or "flex" for cheaper, slower,
+    # occasionally unavailable processing) and the SDK's exponential-backoff retry budget
+    OPENAI_SERVICE_TIER: str = "auto"
+    OPENAI_MAX_RETRIES: int = 6
+    # Per-attempt timeout in seconds, so one stalled call can't hold up a whole run
+    OPENAI_REQUEST_TIMEOUT: float = 60.0
+    # Model calls fail fast for the cooldown once this many transient failures
+    # (after retries) happen within the window
+    CIRCUIT_BREAKER_FAILURES: int = 3
+    CIRCUIT_BREAKER_WINDOW_SECONDS: float = 10.0
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS: float = 5.0
+    # Seconds between Batch API status checks while waiting for a batch report
+    BATCH_POLL_SECONDS: int = 30
+    # Upper bound on interviews run concurrently, to stay within the account's rate limits
+    MAX_CONCURRENCY: int = 4
+    # Connection pool size of the HTTP clients shared by OpenAI calls
+    MAX_CONN: int = 50
+    
     # Interview Configuration
     MAX_INTERVIEW_TURNS: int = 5
+    MEMORY_MAX_MESSAGES: int = 20
+    # Context window of INTERVIEW_MODEL and the room reserved for each reply
+    MAX_CONTEXT_TOKENS: int = 128000
+    MAX_OUTPUT_TOKENS: int = 4096
+    
+    # Async interviews can draft the next follow-up while the employee types; it is
+    # served when their reply embeds within this cosine similarity of the prediction
+    SPECULATIVE_PREFETCH_ENABLED: bool = False
+    SPECULATIVE_MATCH_THRESHOLD: float = 0.9
+    
+    # Turn embeddings stored next to each interview, computed by the first search after it is saved;
+    # topic reports analyze only the TOPIC_REPORT_TOP_K employee turns most similar to the topic
+    EMBEDDING_MODEL: str = "text-embedding-3-small"
+    TOPIC_REPORT_TOP_K: int = 20
+    
+    # Response Cache Configuration (forces temperature 0 so replies are reproducible)
+    RESPONSE_CACHE_ENABLED: bool = False
+    RESPONSE_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    
+    # Report Cache Configuration (keyed on the saved sessions, so new interviews
+    # always produce a fresh report; persisted under CONVERSATIONS_DIR so reports
+    # survive restarts)
+    REPORT_CACHE_SIZE: int = 1024
+    REPORT_CACHE_TTL_SECONDS: int = 3600
+    REPORT_CACHE_PERSIST: bool = True
+    # Per-chunk "map" summaries of report generation, reused across reports so
+    # only new transcripts are summarized
+    MAP_SUMMARY_CACHE_TTL_SECONDS: int = 30 * 24 * 3600
+    # Upper bound on map summaries requested at once within one report
+    MAP_CONCURRENCY: int = 16
     
     # File System Configuration
     CONVERSATIONS_DIR: str = "conversations"
+    # Turn journals untouched for this long belong to interrupted interviews and
+    # are recovered into saved sessions
+    JOURNAL_RECOVERY_AGE_SECONDS: int = 3600
+    IO_MAX_WORKERS: int = min(32, (os.cpu_count() or 1) * 4)
     
-    # Document Processing Configuration
-    CHUNK_SIZE: int = 4000
-    CHUNK_OVERLAP: int = 200
+    # Document Processing Configuration (sizes in report model tokens)
+    CHUNK_SIZE: int = 3000
+    CHUNK_OVERLAP: int = 150
+    # Sessions whose chunks are kept in memory for later reports, least recently used dropped first
+    CHUNK_CACHE_SESSIONS: int = 4096
     
     # Logging Configuration
     LOG_LEVEL: str = "INFO"
     
-    @classmethod
-    def validate(cls) -> bool:
+    def validate(self) -> bool:
         """Validate that all required configuration is present"""
-        if not cls.OPENAI_API_KEY:
-            return False  # Allow demo mode instead of raising error
-        return True
+        # Returns False instead of raising to allow demo mode
+        return _validate_api_key(self.OPENAI_API_KEY)
     
-    @classmethod
-    def is_demo_mode(cls) -> bool:
+    def is_demo_mode(self) -> bool:
         """Check if running in demo mode (no API key)"""
-        return not cls.OPENAI_API_KEY
+        return not self.validate()
     
-    @classmethod
-    def create_directories(cls) -> None:
+    def create_directories(self) -> None:
         """Create necessary directories"""
-        os.makedirs(cls.CONVERSATIONS_DIR, exist_ok=True) 
\ No newline at end of file
+        os.makedirs(self.CONVERSATIONS_DIR, exist_ok=True)
+
+# Not frozen: examples and tests override settings at runtime
+Config = _Config() 
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""
+Test fixtures for Company Alignment Facilitator
+
+This module provides the pytest fixtures shared by the tests in tests.py.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from config import Config
+from models import ConversationRole, InterviewSession
+from data_manager import DataManager
+from report_generator import ReportGenerator
+
+@pytest.fixture
+def session_factory():
+    """Build sessions from (role, content) turns; by default one user message and its reply"""
+    def make(topic="Test Topic", turns=(("user", "User message"), ("assistant", "AI response")), **kwargs):
+        session = InterviewSession(topic=topic, **kwargs)
+        for role, content in turns:
+            session.add_turn(ConversationRole(role), content)
+        return session
+    return make
+
+@pytest.fixture
+def openai_key(monkeypatch):
+    """Configure an API key; Config reads the environment only at import, so it is set on Config"""
+    monkeypatch.setattr(Config, "OPENAI_API_KEY", "test-key")
+
+@pytest.fixture
+def conversations_dir(tmp_path, monkeypatch):
+    """Point Config.CONVERSATIONS_DIR at a fresh directory that pytest cleans up"""
+    monkeypatch.setattr(Config, "CONVERSATIONS_DIR", str(tmp_path))
+    return str(tmp_path)
+
+@pytest.fixture
+def data_manager(conversations_dir):
+    """Data manager storing sessions in the test's conversations directory"""
+    return DataManager()
+
+@pytest.fixture
+def mock_data_manager():
+    """Mock data manager for report generator tests"""
+    return Mock()
+
+@pytest.fixture
+def report_generator(conversations_dir, mock_data_manager, monkeypatch):
+    """Report generator over the mock data manager with a mock model; counts one token per word"""
+    monkeypatch.setattr("report_generator.count_tokens", lambda model, text: len(text.split()))
+    with patch("report_generator.ChatOpenAI"):
+        return ReportGenerator(mock_data_manager)
\ No newline at end of file
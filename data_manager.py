@@ -5,29 +5,131 @@ This module handles file operations, conversation storage, and data persistence.
 """
 
 import os
-import json
+import time
+import uuid
+import itertools
 import logging
+import orjson
+import zstandard
+import numpy as np
 from datetime import datetime
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple
 from pathlib import Path
 
 from config import Config
-from models import InterviewSession, AlignmentReport
+from models import InterviewSession, AlignmentReport, ConversationRole, ConversationTurn
+
+if TYPE_CHECKING:
+    from openai import OpenAI
 
 logger = logging.getLogger(__name__)
 
+# Timestamp format used in saved file names
+_FILENAME_TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
+
+# Directories already created by this process
+_READY_DIRS = set()
+
+def _ensure_directory(path: Path) -> None:
+    """Create a directory once per process; later calls are a set lookup"""
+    if path in _READY_DIRS:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _READY_DIRS.add(path)
+    logger.info(f"Ensured directory exists: {path}")
+
+# Append-only index of per-session summary fields, read by get_statistics and topic filters
+_INDEX_FILENAME = "index.jsonl"
+
+# Directory mtimes are trusted for listing reuse only once older than this
+_LISTING_SETTLE_NS = 2_000_000_000
+
+# Most inputs the embeddings endpoint accepts in one request
+_EMBEDDING_BATCH_SIZE = 2048
+
+# Subdirectory holding per-turn journals of sessions still in progress
+_JOURNAL_DIRNAME = "journal"
+
+# Session IDs journaled by this process and not yet saved; their interviews are still running
+_LIVE_JOURNALS: Set[str] = set()
+
+# Saved sessions are zstd-compressed JSON; plain JSON files from earlier versions still load
+_SESSION_SUFFIX = ".json.zst"
+_SESSION_SUFFIXES = (_SESSION_SUFFIX, ".json")
+
+# Transcripts are small and written once, so a slower level buys ratio cheaply
+_ZSTD_LEVEL = 10
+
+def _read_journal(path: Path) -> Optional[InterviewSession]:
+    """Rebuild a session from its journal; None if not even the header was written"""
+    records = []
+    for line in path.read_bytes().splitlines():
+        try:
+            records.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            # A crash can cut off the last line; the turns before it are whole
+            break
+    if not records:
+        return None
+    
+    header, turns = records[0], records[1:]
+    # The header holds the turn count of when it was written; recount from the turns
+    assistant_turns = sum(1 for turn in turns if turn["role"] == ConversationRole.ASSISTANT.value)
+    # The journal is named by session ID, so saving the session deletes this journal
+    return InterviewSession.from_dict({
+        **header, "conversation": turns, "turns": assistant_turns, "is_active": False, "session_id": path.stem
+    })
+
+def _session_file_id(filepath: str) -> str:
+    """Get a saved session's ID: its file name without the session suffix"""
+    name = Path(filepath).name
+    for suffix in _SESSION_SUFFIXES:
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return Path(filepath).stem
+
+def _read_session_file(filepath: str) -> dict:
+    """Read and parse a saved session file, decompressing it if needed"""
+    data = Path(filepath).read_bytes()
+    if filepath.endswith(".zst"):
+        data = zstandard.decompress(data)
+    return orjson.loads(data)
+
+def _embeddings_path(filepath: str) -> Path:
+    """Get the path of the turn embeddings saved alongside an interview file"""
+    return Path(filepath).parent / f"{_session_file_id(filepath)}.embeddings.npz"
+
+# Per-interview summarization prompt used for Batch API jobs
+BATCH_SUMMARY_PROMPT = """Write a concise summary of the following:
+
+
+"{text}"
+
+
+CONCISE SUMMARY:"""
+
 class DataManager:
     """Handles data persistence and file operations"""
     
     def __init__(self):
         """Initialize the data manager"""
         self.conversations_dir = Path(Config.CONVERSATIONS_DIR)
-        self._ensure_directories()
-    
-    def _ensure_directories(self) -> None:
-        """Ensure necessary directories exist"""
-        self.conversations_dir.mkdir(exist_ok=True)
-        logger.info(f"Ensured directory exists: {self.conversations_dir}")
+        self._openai_client: Optional["OpenAI"] = None
+        # (interview files, stacked turn embeddings, turn references) from the last search
+        self._turn_index: Optional[Tuple[Tuple[str, ...], np.ndarray, List[dict]]] = None
+        # Per-file turn embeddings and references, so new interviews don't reload the old ones
+        self._turn_blocks: Dict[str, Tuple[np.ndarray, List[dict]]] = {}
+        # Interview files whose turns have been embedded, including those without employee turns
+        self._embedded_files: Set[str] = set()
+        # (directory mtime, interview files) from the last listing
+        self._listing: Optional[Tuple[int, List[str]]] = None
+        # (size, mtime, parsed session) per interview file, so unchanged files aren't re-read
+        self._sessions: Dict[str, Tuple[int, int, InterviewSession]] = {}
+        self.session_cache_hits = 0
+        self.session_cache_misses = 0
+        _ensure_directory(self.conversations_dir)
+        self.recover_journals()
     
     def save_interview_session(self, session: InterviewSession) -> str:
         """
@@ -39,12 +141,32 @@ class DataManager:
         Returns:
             Path to the saved file
         """
+        return self.save_interview_sessions([session])[0]
+    
+    def save_interview_sessions(self, sessions: List[InterviewSession]) -> List[str]:
+        """
+        Save several interview sessions
+        
+        Their turns are embedded by the next search_turns call, so saving never
+        waits on the embeddings API.
+        
+        Args:
+            sessions: The interview sessions to save
+            
+        Returns:
+            Paths to the saved files, in session order
+        """
+        return [self._write_session(session) for session in sessions]
+    
+    def _write_session(self, session: InterviewSession) -> str:
+        """Write a session's JSON file and index row; returns the file path"""
         if not session.conversation:
             raise ValueError("Cannot save empty interview session")
         
-        # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        filename = f"interview_{timestamp}.json"
+        # Generate filename with timestamp; the same clock read stamps saved_at
+        now = datetime.now()
+        timestamp = now.strftime(_FILENAME_TIMESTAMP_FORMAT)
+        filename = f"interview_{timestamp}{_SESSION_SUFFIX}"
         filepath = self.conversations_dir / filename
         
         try:
@@ -52,33 +174,245 @@ class DataManager:
             session_data = session.to_dict()
             
             # Add metadata
-            session_data["saved_at"] = datetime.now().isoformat()
+            session_data["saved_at"] = now.isoformat()
             session_data["file_version"] = "1.0"
             
-            # Save to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
+            # orjson writes compact UTF-8 bytes, compressed as one zstd frame
+            payload = zstandard.compress(orjson.dumps(session_data), _ZSTD_LEVEL)
+            
+            # Several sessions can be saved within the same second, also by other
+            # threads or processes; exclusive creation never overwrites one
+            suffix = 1
+            while True:
+                try:
+                    with open(filepath, "xb") as f:
+                        f.write(payload)
+                    break
+                except FileExistsError:
+                    filepath = self.conversations_dir / f"interview_{timestamp}_{suffix}{_SESSION_SUFFIX}"
+                    suffix += 1
+            self._listing = None
             
             logger.info(f"Saved interview session to {filepath}")
-            return str(filepath)
             
         except Exception as e:
             logger.error(f"Error saving interview session: {e}")
             raise
+        
+        # The saved file supersedes the session's turn journal
+        self._journal_path(session.session_id).unlink(missing_ok=True)
+        _LIVE_JOURNALS.discard(session.session_id)
+        
+        # A missed index row is backfilled by the next statistics read
+        try:
+            self._append_index_rows([self._index_row(_session_file_id(str(filepath)), session_data)])
+        except Exception as e:
+            logger.warning(f"Could not index {filepath}: {e}")
+        
+        return str(filepath)
+    
+    def _journal_path(self, session_id: str) -> Path:
+        """Get the path of a session's turn journal"""
+        return self.conversations_dir / _JOURNAL_DIRNAME / f"{session_id}.jsonl"
+    
+    def append_turns(self, session: InterviewSession, turns: List[ConversationTurn]) -> None:
+        """
+        Append turns to the session's journal so an unfinished interview survives a crash
+        
+        The first write also records the session header and any earlier turns;
+        later writes only append the new turns, one JSON object per line.
+        
+        Args:
+            session: The session the turns belong to
+            turns: The turns just added to the session
+        """
+        path = self._journal_path(session.session_id)
+        _LIVE_JOURNALS.add(session.session_id)
+        if path.exists():
+            lines = [turn.to_dict() for turn in turns]
+        else:
+            _ensure_directory(path.parent)
+            header = {key: value for key, value in session.to_dict().items() if key != "conversation"}
+            lines = [header] + [turn.to_dict() for turn in session.conversation]
+        
+        with open(path, "ab") as f:
+            f.write(b"".join(orjson.dumps(line) + b"\n" for line in lines))
+    
+    def _embed_new_files(self, files: List[str]) -> None:
+        """Embed the employee turns of interview files saved since the last search, in one request"""
+        self._embedded_files.intersection_update(files)
+        pending = [
+            f for f in files
+            if f not in self._embedded_files and not _embeddings_path(f).exists()
+        ]
+        if not pending or Config.is_demo_mode():
+            return
+        
+        # Parses are cached, so the sessions aren't read again when the index is built
+        self._load_session_files(pending)
+        saved = [(f, self._sessions[f][2]) for f in pending if f in self._sessions]
+        
+        # Embeddings only serve the search, so a failure leaves those turns out of it until the next one
+        try:
+            self._save_turn_embeddings(saved)
+        except Exception as e:
+            logger.warning(f"Could not embed turns of {len(saved)} sessions: {e}")
+            return
+        self._embedded_files.update(f for f, _ in saved)
+    
+    def recover_journals(self) -> List[str]:
+        """
+        Save the sessions of interrupted interviews, e.g. after a crash, from their turn journals
+        
+        Journals of interviews still running in this process, or written to by
+        another one within Config.JOURNAL_RECOVERY_AGE_SECONDS, are left alone.
+        
+        Returns:
+            Paths to the recovered session files
+        """
+        journal_dir = self.conversations_dir / _JOURNAL_DIRNAME
+        if not journal_dir.is_dir():
+            return []
+        
+        cutoff = time.time() - Config.JOURNAL_RECOVERY_AGE_SECONDS
+        recovered = []
+        for path in journal_dir.glob("*.jsonl"):
+            if path.stem in _LIVE_JOURNALS:
+                continue
+            try:
+                if path.stat().st_mtime > cutoff:
+                    continue
+                session = _read_journal(path)
+                if session is None or not session.conversation:
+                    path.unlink(missing_ok=True)
+                    continue
+                # Saving deletes the journal
+                recovered.append(self._write_session(session))
+            except FileNotFoundError:
+                # Saved or recovered by another process meanwhile
+                continue
+            except Exception as e:
+                logger.warning(f"Could not recover interview journal {path}: {e}")
+        
+        if recovered:
+            logger.info(f"Recovered {len(recovered)} interrupted interviews from their journals")
+        return recovered
+    
+    def _save_turn_embeddings(self, saved: List[Tuple[str, InterviewSession]]) -> None:
+        """Embed the employee's turns of saved sessions and store them next to each file"""
+        turn_indices = [
+            [i for i, turn in enumerate(session.conversation) if turn.role == ConversationRole.USER]
+            for _, session in saved
+        ]
+        texts = [session.conversation[i].content for (_, session), indices in zip(saved, turn_indices) for i in indices]
+        if not texts:
+            return
+        
+        vectors = self.embed_texts(texts)
+        start = 0
+        for (filepath, _), indices in zip(saved, turn_indices):
+            if indices:
+                np.savez(
+                    _embeddings_path(filepath),
+                    vectors=vectors[start:start + len(indices)],
+                    turn_indices=np.asarray(indices, dtype=np.int32)
+                )
+                start += len(indices)
+    
+    def embed_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts with the configured embedding model
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            One unit-length float32 row per text, so a dot product is the cosine similarity
+        """
+        # Each distinct text is sent once; repeated answers share its vector
+        unique_texts = list(dict.fromkeys(texts))
+        client = self._get_openai_client()
+        embeddings = []
+        for start in range(0, len(unique_texts), _EMBEDDING_BATCH_SIZE):
+            response = client.embeddings.create(
+                model=Config.EMBEDDING_MODEL,
+                input=unique_texts[start:start + _EMBEDDING_BATCH_SIZE]
+            )
+            embeddings.extend(item.embedding for item in response.data)
+        
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        positions = {text: i for i, text in enumerate(unique_texts)}
+        return vectors[[positions[text] for text in texts]]
+    
+    def search_turns(self, query: str, k: int = 20) -> List[dict]:
+        """
+        Find the employee turns most similar to a query across all saved interviews
+        
+        Args:
+            query: Text to search for, e.g. a report topic
+            k: Maximum number of turns to return
+            
+        Returns:
+            Dictionaries with score, filepath, topic and content, most similar first
+        """
+        matrix, refs = self._load_turn_index()
+        if not refs:
+            return []
+        
+        scores = matrix @ self.embed_texts([query])[0]
+        k = min(k, len(refs))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [{"score": float(scores[i]), **refs[i]} for i in top]
+    
+    def _load_turn_index(self) -> Tuple[np.ndarray, List[dict]]:
+        """Stack the saved turn embeddings into one matrix; only files new since the last call are read"""
+        all_files = self.get_all_interview_files()
+        self._embed_new_files(all_files)
+        files = tuple(f for f in all_files if _embeddings_path(f).exists())
+        if self._turn_index is not None and self._turn_index[0] == files:
+            return self._turn_index[1], self._turn_index[2]
+        
+        self._turn_blocks = {f: block for f, block in self._turn_blocks.items() if f in files}
+        for filepath in files:
+            if filepath in self._turn_blocks:
+                continue
+            try:
+                with np.load(_embeddings_path(filepath)) as data:
+                    vectors, turn_indices = data["vectors"], data["turn_indices"]
+                session = self.load_interview_session(filepath)
+            except Exception as e:
+                logger.warning(f"Skipping turn embeddings of {filepath}: {e}")
+                continue
+            
+            self._turn_blocks[filepath] = (vectors, [
+                {"filepath": filepath, "topic": session.topic, "content": session.conversation[i].content}
+                for i in turn_indices
+            ])
+        
+        blocks = [self._turn_blocks[f] for f in files if f in self._turn_blocks]
+        # One contiguous float32 matrix keeps the scoring a single BLAS matrix-vector product
+        matrix = (
+            np.ascontiguousarray(np.concatenate([vectors for vectors, _ in blocks]), dtype=np.float32)
+            if blocks else np.empty((0, 0), dtype=np.float32)
+        )
+        refs = [ref for _, block_refs in blocks for ref in block_refs]
+        self._turn_index = (files, matrix, refs)
+        return matrix, refs
     
     def load_interview_session(self, filepath: str) -> InterviewSession:
         """
-        Load an interview session from a JSON file
+        Load an interview session from a saved session file
         
         Args:
-            filepath: Path to the JSON file
+            filepath: Path to the session file (.json.zst, or .json from earlier versions)
             
         Returns:
             Loaded interview session
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                session_data = json.load(f)
+            session_data = _read_session_file(filepath)
             
             session = InterviewSession.from_dict(session_data)
             logger.info(f"Loaded interview session from {filepath}")
@@ -90,18 +424,43 @@ class DataManager:
     
     def get_all_interview_files(self) -> List[str]:
         """
-        Get all interview JSON files in the conversations directory
+        Get all saved interview files in the conversations directory
         
         Returns:
             List of file paths
         """
         try:
-            json_files = list(self.conversations_dir.glob("*.json"))
-            return [str(f) for f in json_files]
+            # Adding or removing a file changes the directory mtime; until then the
+            # last listing is still valid
+            mtime = os.stat(self.conversations_dir).st_mtime_ns
+            if self._listing is not None and self._listing[0] == mtime:
+                return list(self._listing[1])
+            
+            # scandir reuses the directory entry's type info instead of stat-ing each file
+            with os.scandir(self.conversations_dir) as entries:
+                files = sorted(
+                    entry.path for entry in entries
+                    if entry.name.endswith(_SESSION_SUFFIXES) and entry.is_file()
+                )
+            
+            # mtimes are coarse: a file added within the same tick as this scan
+            # would leave the mtime unchanged, so only keep listings of settled directories
+            if time.time_ns() - mtime > _LISTING_SETTLE_NS:
+                self._listing = (mtime, files)
+            return files
         except Exception as e:
             logger.error(f"Error getting interview files: {e}")
             return []
     
+    def list_session_ids(self) -> List[str]:
+        """
+        Get the IDs of all saved interview sessions
+        
+        Returns:
+            Sorted list of interview file names without their extension
+        """
+        return [_session_file_id(filepath) for filepath in self.get_all_interview_files()]
+    
     def load_all_interview_sessions(self) -> List[InterviewSession]:
         """
         Load all interview sessions from the conversations directory
@@ -109,19 +468,131 @@ class DataManager:
         Returns:
             List of interview sessions
         """
-        sessions = []
         file_paths = self.get_all_interview_files()
+        sessions = self._load_session_files(file_paths)
+        
+        # Forget parses of deleted files
+        for filepath in self._sessions.keys() - set(file_paths):
+            del self._sessions[filepath]
         
+        return sessions
+    
+    def load_sessions_by_ids(self, session_ids: List[str]) -> List[InterviewSession]:
+        """
+        Load only the given interview sessions, e.g. ones selected from the session index
+        
+        Args:
+            session_ids: IDs of saved sessions, as in index rows
+            
+        Returns:
+            The sessions still on disk, in file order
+        """
+        wanted = set(session_ids)
+        return self._load_session_files([
+            filepath for filepath in self.get_all_interview_files()
+            if _session_file_id(filepath) in wanted
+        ])
+    
+    def _load_session_files(self, file_paths: List[str]) -> List[InterviewSession]:
+        """Load interview files, reusing the parse of any file unchanged since it was last read"""
+        # Files with the size and mtime of their last parse are served from it
+        loaded: Dict[str, InterviewSession] = {}
+        stale = []
         for filepath in file_paths:
             try:
-                session = self.load_interview_session(filepath)
-                sessions.append(session)
+                stat = os.stat(filepath)
+            except FileNotFoundError:
+                continue
+            entry = self._sessions.get(filepath)
+            if entry is not None and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+                loaded[filepath] = entry[2]
+            else:
+                stale.append((filepath, stat.st_size, stat.st_mtime_ns))
+        self.session_cache_hits += len(loaded)
+        self.session_cache_misses += len(stale)
+        
+        if stale:
+            # File reads, decompression and orjson parsing release the GIL, so load files concurrently
+            with ThreadPoolExecutor(max_workers=min(Config.IO_MAX_WORKERS, len(stale))) as executor:
+                futures = [
+                    (filepath, size, mtime, executor.submit(self.load_interview_session, filepath))
+                    for filepath, size, mtime in stale
+                ]
+                for filepath, size, mtime, future in futures:
+                    try:
+                        loaded[filepath] = future.result()
+                    except Exception as e:
+                        logger.warning(f"Skipping corrupted file {filepath}: {e}")
+                        continue
+                    self._sessions[filepath] = (size, mtime, loaded[filepath])
+        
+        # Keep listing order so results stay deterministic
+        sessions = [loaded[filepath] for filepath in file_paths if filepath in loaded]
+        logger.info(f"Loaded {len(sessions)} interview sessions ({len(stale)} read from disk)")
+        return sessions
+    
+    def get_cache_statistics(self) -> dict:
+        """Get hit and miss counts of the parsed session cache"""
+        return {"hits": self.session_cache_hits, "misses": self.session_cache_misses}
+    
+    @staticmethod
+    def _index_row(session_id: str, session_data: dict) -> dict:
+        """Build the index row holding a session's summary fields"""
+        return {
+            "id": session_id,
+            "topic": session_data["topic"],
+            "conversation_length": len(session_data.get("conversation", ())),
+            "turns": session_data.get("turns", 0)
+        }
+    
+    def _append_index_rows(self, rows: List[dict]) -> None:
+        """Append rows to the session index"""
+        with open(self.conversations_dir / _INDEX_FILENAME, "ab") as f:
+            f.write(b"".join(orjson.dumps(row) + b"\n" for row in rows))
+    
+    def load_session_index(self) -> List[dict]:
+        """
+        Load the session index, reconciled with the interview files on disk
+        
+        Sessions missing from the index are read once and appended; rows of
+        deleted sessions are compacted away.
+        
+        Returns:
+            One index row (id, topic, conversation_length, turns) per stored
+            interview, in file order
+        """
+        index_path = self.conversations_dir / _INDEX_FILENAME
+        rows = {}
+        if index_path.exists():
+            for line in index_path.read_bytes().splitlines():
+                try:
+                    row = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # Blank or partially written line
+                    continue
+                rows[row["id"]] = row
+        
+        session_files = {_session_file_id(filepath): filepath for filepath in self.get_all_interview_files()}
+        
+        backfill = []
+        for session_id, filepath in session_files.items():
+            if session_id in rows:
+                continue
+            try:
+                row = self._index_row(session_id, _read_session_file(filepath))
             except Exception as e:
                 logger.warning(f"Skipping corrupted file {filepath}: {e}")
                 continue
+            rows[session_id] = row
+            backfill.append(row)
         
-        logger.info(f"Loaded {len(sessions)} interview sessions")
-        return sessions
+        if len(rows) > len(session_files):
+            live_rows = [row for session_id, row in rows.items() if session_id in session_files]
+            index_path.write_bytes(b"".join(orjson.dumps(row) + b"\n" for row in live_rows))
+        elif backfill:
+            self._append_index_rows(backfill)
+        
+        return [rows[session_id] for session_id in sorted(session_files) if session_id in rows]
     
     def delete_interview_file(self, filepath: str) -> bool:
         """
@@ -137,6 +608,8 @@ class DataManager:
             path = Path(filepath)
             if path.exists() and path.is_file():
                 path.unlink()
+                _embeddings_path(filepath).unlink(missing_ok=True)
+                self._listing = None
                 logger.info(f"Deleted interview file: {filepath}")
                 return True
             else:
@@ -146,7 +619,24 @@ class DataManager:
             logger.error(f"Error deleting file {filepath}: {e}")
             return False
     
-    def get_conversation_text(self, session: InterviewSession) -> str:
+    @staticmethod
+    def iter_conversation_entries(session: InterviewSession) -> Iterator[str]:
+        """
+        Yield the entries of an interview's text: the topic line, then one line per turn
+        
+        Args:
+            session: The interview session
+            
+        Yields:
+            Formatted entries, in conversation order
+        """
+        return itertools.chain(
+            [f"Topic: {session.topic}"],
+            (f"{turn.role.value.title()}: {turn.content}" for turn in session.conversation)
+        )
+    
+    @staticmethod
+    def get_conversation_text(session: InterviewSession) -> str:
         """
         Convert an interview session to text format for processing
         
@@ -156,14 +646,150 @@ class DataManager:
         Returns:
             Formatted conversation text
         """
-        lines = [f"Topic: {session.topic}\n"]
+        # Blank line between entries so chunks break on turn boundaries
+        return "\n\n".join(DataManager.iter_conversation_entries(session))
+    
+    def submit_batch_job(self, sessions: List[InterviewSession], groups: Optional[List[int]] = None) -> str:
+        """
+        Submit per-interview summarization requests to the OpenAI Batch API
+        
+        Args:
+            sessions: The interview sessions to summarize
+            groups: Optional group index per session, recovered by poll_batch_groups
+            
+        Returns:
+            ID of the created batch
+        """
+        if not sessions:
+            raise ValueError("Cannot submit an empty batch job")
+        
+        if groups is not None and len(groups) != len(sessions):
+            raise ValueError("Expected one group index per session")
+        
+        # Unique per submission, so batches submitted in the same second keep their own file
+        timestamp = datetime.now().strftime(_FILENAME_TIMESTAMP_FORMAT)
+        filepath = self.conversations_dir / f"batch_{timestamp}_{uuid.uuid4().hex}.jsonl"
+        
+        try:
+            # One /v1/chat/completions request per interview
+            with open(filepath, 'xb') as f:
+                for i, session in enumerate(sessions):
+                    custom_id = f"session_{i}" if groups is None else f"group{groups[i]}_session_{i}"
+                    request = {
+                        "custom_id": custom_id,
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {
+                            "model": Config.REPORT_MODEL,
+                            "temperature": Config.OPENAI_TEMPERATURE,
+                            "messages": [{
+                                "role": "user",
+                                "content": BATCH_SUMMARY_PROMPT.format(text=self.get_conversation_text(session))
+                            }]
+                        }
+                    }
+                    f.write(orjson.dumps(request) + b"\n")
+            
+            client = self._get_openai_client()
+            with open(filepath, 'rb') as f:
+                batch_file = client.files.create(file=f, purpose="batch")
+            
+            batch = client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            
+            logger.info(f"Submitted batch {batch.id} with {len(sessions)} interviews")
+            return batch.id
+            
+        except Exception as e:
+            logger.error(f"Error submitting batch job: {e}")
+            raise
+        finally:
+            # The uploaded copy is the one the batch reads; don't keep full transcripts around
+            filepath.unlink(missing_ok=True)
+    
+    def poll_batch(self, batch_id: str) -> Optional[List[str]]:
+        """
+        Check a batch job and load its results once it has completed
         
-        for turn in session.conversation:
-            role = turn.role.value.title()
-            content = turn.content
-            lines.append(f"{role}: {content}\n")
+        Args:
+            batch_id: ID returned by submit_batch_job
+            
+        Returns:
+            Per-interview summaries in submission order, or None if the batch is still running
+        """
+        summaries = self._load_batch_results(batch_id)
+        if summaries is None:
+            return None
+        
+        # Output lines are not guaranteed to be in input order
+        ordered_ids = sorted(summaries, key=lambda custom_id: int(custom_id.rsplit("_", 1)[1]))
+        return [summaries[custom_id] for custom_id in ordered_ids]
+    
+    def poll_batch_groups(self, batch_id: str) -> Optional[Dict[int, List[str]]]:
+        """
+        Check a grouped batch job and load its results once it has completed
+        
+        Args:
+            batch_id: ID returned by submit_batch_job with groups
+            
+        Returns:
+            Per-interview summaries by group index, each in submission order,
+            or None if the batch is still running
+        """
+        summaries = self._load_batch_results(batch_id)
+        if summaries is None:
+            return None
+        
+        grouped: Dict[int, List[str]] = {}
+        for custom_id in sorted(summaries, key=lambda custom_id: int(custom_id.rsplit("_", 1)[1])):
+            group = int(custom_id.split("_", 1)[0][len("group"):])
+            grouped.setdefault(group, []).append(summaries[custom_id])
+        return grouped
+    
+    def _load_batch_results(self, batch_id: str) -> Optional[Dict[str, str]]:
+        """Load the successful results of a completed batch by custom_id, or None if still running"""
+        client = self._get_openai_client()
+        batch = client.batches.retrieve(batch_id)
+        
+        if batch.status in ("failed", "expired", "cancelled"):
+            raise RuntimeError(f"Batch {batch_id} ended with status: {batch.status}")
+        
+        if batch.status != "completed":
+            return None
+        
+        output = client.files.content(batch.output_file_id).text
         
-        return "\n".join(lines)
+        summaries = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                logger.warning(f"Skipping failed batch request {record.get('custom_id')}")
+                continue
+            summaries[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        
+        logger.info(f"Loaded {len(summaries)} results from batch {batch_id}")
+        return summaries
+    
+    def _get_openai_client(self) -> "OpenAI":
+        """Get the OpenAI client used for batch jobs, creating it on first use"""
+        if self._openai_client is None:
+            # Imported on first use so the SDK isn't loaded in demo mode
+            from openai import OpenAI
+            from http_pool import get_http_client
+            
+            self._openai_client = OpenAI(
+                api_key=Config.OPENAI_API_KEY,
+                http_client=get_http_client(),
+                timeout=Config.OPENAI_REQUEST_TIMEOUT,
+                max_retries=Config.OPENAI_MAX_RETRIES
+            )
+        return self._openai_client
     
     def get_statistics(self) -> dict:
         """
@@ -173,9 +799,10 @@ class DataManager:
             Dictionary with statistics
         """
         try:
-            sessions = self.load_all_interview_sessions()
+            # One read of the index instead of parsing every interview file
+            rows = self.load_session_index()
             
-            if not sessions:
+            if not rows:
                 return {
                     "total_interviews": 0,
                     "total_conversations": 0,
@@ -183,15 +810,14 @@ class DataManager:
                     "topics": []
                 }
             
-            total_conversations = sum(len(s.conversation) for s in sessions)
-            average_turns = sum(s.turns for s in sessions) / len(sessions)
-            topics = list(set(s.topic for s in sessions))
+            conversation_lengths = np.fromiter((row["conversation_length"] for row in rows), dtype=np.int64, count=len(rows))
+            turns = np.fromiter((row["turns"] for row in rows), dtype=np.int64, count=len(rows))
             
             return {
-                "total_interviews": len(sessions),
-                "total_conversations": total_conversations,
-                "average_turns": round(average_turns, 2),
-                "topics": topics
+                "total_interviews": len(rows),
+                "total_conversations": int(conversation_lengths.sum()),
+                "average_turns": round(float(turns.mean()), 2),
+                "topics": list(dict.fromkeys(row["topic"] for row in rows))
             }
             
         except Exception as e:
@@ -6,11 +6,53 @@ This script demonstrates how to use the CompanyAlignmentFacilitator class
 programmatically without the Gradio interface.
 """
 
-import os
 import sys
+import asyncio
+import argparse
+import textwrap
 from facilitator import CompanyAlignmentFacilitator
 from config import Config
 
+REPORT_PREVIEW_CHARS = 1000
+
+def preview_report(report: str, width: int = REPORT_PREVIEW_CHARS) -> str:
+    """
+    Shorten a report for console output without splitting words
+    
+    Args:
+        report: The full report text
+        width: Maximum number of characters to keep
+    
+    Returns:
+        The report unchanged if it fits, otherwise its first words plus "..."
+    """
+    if len(report) <= width:
+        return report
+    
+    # Shorten only the tail line so the report keeps its markdown line breaks
+    head = report[:width]
+    cut = head.rfind("\n")
+    if width - cut - 1 < len("..."):
+        # The last line break leaves no room for the placeholder; hard cut instead
+        return head[:width - 3] + "..."
+    
+    # Shorten the whole tail line, so a word running past the budget is dropped
+    # rather than cut, and no words of the following lines are pulled in
+    budget = width - cut - 1
+    line_end = report.find("\n", width)
+    tail_line = report[cut + 1:line_end if line_end != -1 else len(report)]
+    tail = textwrap.shorten(tail_line, width=budget, placeholder="...")
+    if not tail.endswith("..."):
+        # The tail line fits once its spaces are collapsed, but the lines after it are cut
+        words = tail.split()
+        while words and len(" ".join(words)) + len("...") > budget:
+            words.pop()
+        tail = " ".join(words) + "..."
+    if tail == "...":
+        # A single word longer than the budget; fall back to a hard cut
+        tail = head[cut + 1:width - 3] + "..."
+    return head[:cut + 1] + tail
+
 def example_interview_workflow():
     """Example workflow showing how to conduct interviews and generate reports"""
     
@@ -45,16 +87,17 @@ def example_interview_workflow():
         print(f"\n--- Turn {i} ---")
         print(f"Employee: {response}")
         
-        # Get AI response
-        ai_response, is_complete, error = facilitator.conduct_interview(response)
-        
-        if error:
-            print(f"Error: {error}")
+        # Stream the AI response as it is generated
+        print("AI Interviewer: ", end="", flush=True)
+        try:
+            for chunk in facilitator.conduct_interview_stream(response):
+                print(chunk, end="", flush=True)
+            print()
+        except Exception as e:
+            print(f"\nError: {e}")
             break
         
-        print(f"AI Interviewer: {ai_response}")
-        
-        if is_complete:
+        if facilitator.get_current_session().is_complete():
             print("\n✅ Interview completed!")
             break
     
@@ -65,27 +108,31 @@ def example_interview_workflow():
     print("=" * 50)
     print("SAMPLE REPORT:")
     print("=" * 50)
-    print(report[:1000] + "..." if len(report) > 1000 else report)
+    print(preview_report(report))
     
     # End the session
     print(f"\n⏹️ Ending session...")
     result = facilitator.end_session()
     print(f"Result: {result}")
 
-def example_multiple_interviews():
+async def run_scenarios(facilitator: CompanyAlignmentFacilitator, topic: str, scenarios: list) -> list:
+    """Run interview scenarios concurrently over the facilitator's pooled HTTP client"""
+    async with facilitator:
+        return await facilitator.run_interview_scenarios(topic, scenarios)
+
+def example_multiple_interviews(use_batch: bool = False):
     """Example showing how to conduct multiple interviews for a comprehensive report"""
     
+    # The comprehensive report is not latency-critical, so generate it on the
+    # cheaper flex service tier
     try:
-        facilitator = CompanyAlignmentFacilitator()
+        facilitator = CompanyAlignmentFacilitator(report_service_tier="flex")
         print("✅ Facilitator initialized for multiple interviews example")
     except ValueError as e:
         print(f"❌ Initialization failed: {e}")
         return
     
-    # Start session
     topic = "Remote work policies and team productivity"
-    facilitator.start_new_session(topic)
-    print(f"Started session: {topic}")
     
     # Multiple interview scenarios
     interview_scenarios = [
@@ -115,40 +162,27 @@ def example_multiple_interviews():
         ]
     ]
     
-    # Conduct multiple interviews
-    for i, responses in enumerate(interview_scenarios, 1):
-        print(f"\n--- Conducting Interview {i} ---")
-        
-        for j, response in enumerate(responses, 1):
-            print(f"Turn {j}: {response[:50]}...")
-            ai_response, is_complete, error = facilitator.conduct_interview(response)
-            
-            if error:
-                print(f"Error: {error}")
-                break
-            
-            if is_complete:
-                break
-        
-        print(f"Interview {i} completed!")
-        
-        # End current session and start new one for next interview
-        if i < len(interview_scenarios):
-            facilitator.end_session()
-            facilitator.start_new_session(topic)
+    # The interviews are independent, so they run concurrently and the total
+    # wait is roughly that of the slowest interview
+    print(f"\n--- Conducting {len(interview_scenarios)} interviews concurrently ---")
+    saved_files = asyncio.run(run_scenarios(facilitator, topic, interview_scenarios))
+    for i, filepath in enumerate(saved_files, 1):
+        print(f"Interview {i} completed! Saved to {filepath}")
     
-    # Generate comprehensive report
-    print(f"\n📊 Generating comprehensive alignment report...")
-    report = facilitator.generate_alignment_report()
+    # Generate comprehensive report; batch mode goes through the Batch API at
+    # half the cost, with up to 24h turnaround
+    if use_batch:
+        print(f"\n📊 Generating comprehensive alignment report through the Batch API...")
+    else:
+        print(f"\n📊 Generating comprehensive alignment report...")
+    report = facilitator.generate_alignment_report(mode="batch" if use_batch else "sync")
     print(f"\nComprehensive report generated!")
     print("=" * 60)
     print("COMPREHENSIVE ALIGNMENT REPORT:")
     print("=" * 60)
     print(report)
     
-    # End session
-    facilitator.end_session()
-    print(f"\n✅ All interviews completed and session ended!")
+    print(f"\n✅ All interviews completed!")
 
 def example_topic_specific_reports():
     """Example showing how to generate topic-specific and comparative reports"""
@@ -168,7 +202,7 @@ def example_topic_specific_reports():
         print("=" * 40)
         print("TOPIC-SPECIFIC REPORT:")
         print("=" * 40)
-        print(topic_report[:800] + "..." if len(topic_report) > 800 else topic_report)
+        print(preview_report(topic_report, width=800))
     except Exception as e:
         print(f"No data found for topic-specific report: {e}")
     
@@ -184,7 +218,7 @@ def example_topic_specific_reports():
         print("=" * 40)
         print("COMPARATIVE REPORT:")
         print("=" * 40)
-        print(comparative_report[:800] + "..." if len(comparative_report) > 800 else comparative_report)
+        print(preview_report(comparative_report, width=800))
     except Exception as e:
         print(f"No data found for comparative report: {e}")
 
@@ -217,56 +251,74 @@ def example_statistics():
     else:
         print(f"\nNo active session")
 
+# Examples selectable with --example
+EXAMPLES = {
+    "interview": example_interview_workflow,
+    "multi": example_multiple_interviews,
+    "topic": example_topic_specific_reports,
+    "stats": example_statistics,
+}
+
+async def run_all_examples(use_batch: bool = False) -> None:
+    """
+    Run every example, overlapping the independent ones
+    
+    The two interview examples keep separate sessions, so they run together;
+    the report and statistics examples read the interviews they save, so they
+    run together afterwards. Each example runs in its own thread because the
+    examples call the facilitator's blocking API.
+    
+    Args:
+        use_batch: Generate the multiple-interview report via the Batch API
+    """
+    await asyncio.gather(
+        asyncio.to_thread(example_interview_workflow),
+        asyncio.to_thread(example_multiple_interviews, use_batch)
+    )
+    await asyncio.gather(
+        asyncio.to_thread(example_topic_specific_reports),
+        asyncio.to_thread(example_statistics)
+    )
+
 def main():
     """Main example function"""
+    parser = argparse.ArgumentParser(description="Company Alignment Facilitator examples")
+    parser.add_argument(
+        "--example",
+        choices=[*EXAMPLES, "all"],
+        default="interview",
+        help="Example to run: single interview workflow, multiple interviews for a comprehensive "
+             "report, topic-specific and comparative reports, system statistics, or all of them"
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Generate the multiple-interview report offline via the OpenAI Batch API"
+    )
+    args = parser.parse_args()
+    
     print("Company Alignment Facilitator - Example Usage")
     print("=" * 50)
     
     # Check if API key is set
-    if not os.getenv("OPENAI_API_KEY"):
+    if Config.is_demo_mode():
         print("❌ OPENAI_API_KEY environment variable not set!")
         print("Please set your OpenAI API key before running this example.")
         print("Example: export OPENAI_API_KEY='your-api-key-here'")
         sys.exit(1)
     
-    print("Choose an example to run:")
-    print("1. Single interview workflow")
-    print("2. Multiple interviews for comprehensive report")
-    print("3. Topic-specific and comparative reports")
-    print("4. System statistics")
-    print("5. Run all examples")
-    
-    choice = input("\nEnter your choice (1-5): ").strip()
-    
-    if choice == "1":
-        example_interview_workflow()
-    elif choice == "2":
-        example_multiple_interviews()
-    elif choice == "3":
-        example_topic_specific_reports()
-    elif choice == "4":
-        example_statistics()
-    elif choice == "5":
+    if args.example == "all":
         print("\n" + "="*60)
         print("RUNNING ALL EXAMPLES")
         print("="*60)
         
-        print("\n1. Single interview workflow:")
-        example_interview_workflow()
-        
-        print("\n2. Multiple interviews:")
-        example_multiple_interviews()
-        
-        print("\n3. Topic-specific reports:")
-        example_topic_specific_reports()
-        
-        print("\n4. Statistics:")
-        example_statistics()
+        asyncio.run(run_all_examples(use_batch=args.batch))
         
         print("\n✅ All examples completed!")
+    elif args.example == "multi":
+        example_multiple_interviews(use_batch=args.batch)
     else:
-        print("Invalid choice. Running single interview workflow...")
-        example_interview_workflow()
+        EXAMPLES[args.example]()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
\ No newline at end of file
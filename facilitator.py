@@ -5,39 +5,140 @@ This module orchestrates all components and provides the high-level interface
 for the alignment facilitation system.
 """
 
+import os
+import asyncio
 import logging
-from typing import Optional, Tuple
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Final, Iterator, List, Optional, Tuple
 
 from config import Config
-from models import InterviewSession, AlignmentReport
-from ai_interviewer import AIInterviewer
+from models import InterviewSession, AlignmentReport, ConversationRole
 from data_manager import DataManager
-from report_generator import ReportGenerator
+from llm_cache import DiskBackend, LLMCache, MemoryBackend, TieredBackend
 
 logger = logging.getLogger(__name__)
 
+# Static report shown in demo mode
+_DEMO_REPORT: Final[str] = """# Company Alignment Facilitator - Demo Report
+
+## 🔑 Demo Mode Active
+
+This is a demonstration of what an alignment report would look like. To generate real reports with actual interview data, please:
+
+1. **Set your OpenAI API key**: `export OPENAI_API_KEY="your-api-key-here"`
+2. **Restart the application**: The AI interviewer will then be available
+3. **Conduct interviews**: Use the Employee Interview tab to gather responses
+4. **Generate real reports**: Click this button again for AI-powered analysis
+
+## Sample Report Structure
+
+### Executive Summary
+When you have real interview data, this section will contain an AI-generated summary of all the key themes, consensus areas, and misalignments discovered across your team interviews.
+
+### Analysis Details
+- **Total Interviews Analyzed**: 0 (Demo Mode)
+- **Alignment Topic**: No active session
+- **Report Generated**: Demo Mode
+
+### Key Features Available with API Key
+
+✅ **AI-Powered Interviews**: Contextual follow-up questions  
+✅ **Automatic Transcription**: Complete conversation logging  
+✅ **Intelligent Analysis**: Pattern recognition across responses  
+✅ **Actionable Insights**: Specific recommendations for alignment  
+
+### Getting Started
+
+1. **Get OpenAI API Key**: Visit [platform.openai.com/api-keys](https://platform.openai.com/api-keys)
+2. **Set Environment Variable**: `export OPENAI_API_KEY="sk-..."`
+3. **Restart Application**: `python main.py`
+4. **Start First Session**: Enter a topic and begin interviewing team members
+
+---
+*This is a demo report. Real reports will contain AI-generated insights from your actual team interviews.*
+"""
+
+REPORT_MODES = ("sync", "batch")
+
+def _check_report_mode(mode: str) -> None:
+    """Reject unknown report generation modes"""
+    if mode not in REPORT_MODES:
+        raise ValueError(f"Unknown report mode: {mode!r}; expected one of {REPORT_MODES}")
+
 class CompanyAlignmentFacilitator:
     """Main orchestrator for the Company Alignment Facilitator system"""
     
-    def __init__(self):
-        """Initialize the facilitator with all components"""
+    __slots__ = (
+        "is_demo_mode", "data_manager", "cache", "ai_interviewer", "report_generator",
+        "_http", "_speculation", "_writer", "_pending_saves", "_pending_lock"
+    )
+    
+    def __init__(self, report_service_tier: Optional[str] = None):
+        """
+        Initialize the facilitator with all components
+        
+        Args:
+            report_service_tier: OpenAI service tier for report generation;
+                defaults to Config.OPENAI_SERVICE_TIER
+        """
         # Check configuration
         self.is_demo_mode = Config.is_demo_mode()
         Config.create_directories()
         
         # Initialize components
         self.data_manager = DataManager()
+        backend = MemoryBackend(maxsize=Config.REPORT_CACHE_SIZE)
+        if Config.REPORT_CACHE_PERSIST:
+            backend = TieredBackend(backend, DiskBackend(os.path.join(Config.CONVERSATIONS_DIR, ".report_cache")))
+        self.cache = LLMCache(backend, ttl_seconds=Config.REPORT_CACHE_TTL_SECONDS)
         
         if not self.is_demo_mode:
+            # Imported here so demo mode and CLI startup skip loading the LLM stack
+            from ai_interviewer import AIInterviewer
+            from report_generator import ReportGenerator
+            
             # Full initialization with AI components
             self.ai_interviewer = AIInterviewer()
-            self.report_generator = ReportGenerator(self.data_manager)
+            self.report_generator = ReportGenerator(self.data_manager, service_tier=report_service_tier)
             logger.info("Company Alignment Facilitator initialized successfully")
         else:
             # Demo mode initialization
             self.ai_interviewer = None
             self.report_generator = None
             logger.info("Company Alignment Facilitator initialized in DEMO MODE (no OpenAI API key)")
+        
+        # Pooled HTTP client owned while used as an async context manager
+        self._http = None
+        # Pending draft of the next turn: (session turns when drafted, predicted reply embedding, follow-up)
+        self._speculation: Optional["asyncio.Task[Optional[Tuple[int, np.ndarray, str]]]"] = None
+        # Completed sessions are saved off the interview turn; a single writer keeps saves in order
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-writer")
+        self._pending_saves: List[InterviewSession] = []
+        self._pending_lock = threading.Lock()
+    
+    async def __aenter__(self) -> "CompanyAlignmentFacilitator":
+        """
+        Open one pooled HTTP client for all async interview calls
+        
+        Enter the context before starting sessions: the interviewer is rebuilt
+        on the shared client.
+        """
+        if not self.is_demo_mode:
+            from ai_interviewer import AIInterviewer
+            from http_pool import new_async_http_client
+            
+            self._http = new_async_http_client()
+            self.ai_interviewer.close()
+            self.ai_interviewer = AIInterviewer(http_async_client=self._http)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the pooled HTTP client"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
     
     def start_new_session(self, topic: str) -> str:
         """
@@ -53,11 +154,12 @@ class CompanyAlignmentFacilitator:
             return "🔑 Demo Mode: Please set your OPENAI_API_KEY environment variable to start real sessions. You can explore the interface and see example data."
         
         try:
-            if not topic.strip():
+            topic = topic.strip()
+            if not topic:
                 return "Please enter a valid alignment topic."
             
             # Start the AI interview session
-            session = self.ai_interviewer.start_session(topic.strip())
+            session = self.ai_interviewer.start_session(topic)
             
             logger.info(f"Started new alignment session: {topic}")
             return f"Alignment session started! Topic: '{topic}'. The interview interface is now active."
@@ -82,10 +184,12 @@ class CompanyAlignmentFacilitator:
         try:
             # Conduct the interview
             ai_response, is_complete, error = self.ai_interviewer.conduct_interview(message)
+            if error is None:
+                self._journal_last_turn()
             
             # If interview is complete, save the session
             if is_complete:
-                self._save_current_session()
+                self._save_in_background()
             
             return ai_response, is_complete, error
             
@@ -93,6 +197,236 @@ class CompanyAlignmentFacilitator:
             logger.error(f"Error conducting interview: {e}")
             return "", False, f"An error occurred: {str(e)}"
     
+    def conduct_interview_stream(self, message: str) -> Iterator[str]:
+        """
+        Conduct an interview with the given message, yielding the response as it is generated
+        
+        Args:
+            message: The user's message
+            
+        Yields:
+            Chunks of the AI response; the session is queued for saving once
+            the stream ends if the interview is complete
+        """
+        if self.is_demo_mode:
+            raise RuntimeError("🔑 Demo Mode: Please set your OPENAI_API_KEY environment variable to use the AI interviewer.")
+        
+        yield from self.ai_interviewer.conduct_interview_stream(message)
+        self._journal_last_turn()
+        
+        # If interview is complete, save the session
+        if self.ai_interviewer.get_current_session().is_complete():
+            self._save_in_background()
+    
+    async def aconduct_interview_stream(self, message: str) -> AsyncIterator[str]:
+        """
+        Async counterpart of conduct_interview_stream
+        
+        Args:
+            message: The user's message
+            
+        Yields:
+            Chunks of the AI response
+        """
+        if self.is_demo_mode:
+            raise RuntimeError("🔑 Demo Mode: Please set your OPENAI_API_KEY environment variable to use the AI interviewer.")
+        
+        async for chunk in self.ai_interviewer.aconduct_interview(message):
+            yield chunk
+        self._journal_last_turn()
+        
+        # If interview is complete, save the session
+        if self.ai_interviewer.get_current_session().is_complete():
+            self._save_in_background()
+    
+    async def aconduct_interview(self, message: str) -> Tuple[str, bool, Optional[str]]:
+        """
+        Async counterpart of conduct_interview
+        
+        Args:
+            message: The user's message
+            
+        Returns:
+            Tuple of (ai_response, is_complete, error_message)
+        """
+        if self.is_demo_mode:
+            return "", False, "🔑 Demo Mode: Please set your OPENAI_API_KEY environment variable to use the AI interviewer."
+        
+        try:
+            ai_response = await self._take_speculation(message)
+            if ai_response is not None:
+                self.ai_interviewer.record_turn(message, ai_response)
+            else:
+                chunks = [chunk async for chunk in self.ai_interviewer.aconduct_interview(message)]
+                ai_response = "".join(chunks)
+            self._journal_last_turn()
+            is_complete = self.ai_interviewer.get_current_session().is_complete()
+            
+            # If interview is complete, save the session; otherwise draft the next turn
+            if is_complete:
+                self._save_in_background()
+            else:
+                self._start_speculation()
+            
+            return ai_response, is_complete, None
+            
+        except Exception as e:
+            logger.error(f"Error conducting interview: {e}")
+            return "", False, f"An error occurred: {str(e)}"
+    
+    def _start_speculation(self) -> None:
+        """Start drafting the next turn in the background while the employee types"""
+        if Config.SPECULATIVE_PREFETCH_ENABLED:
+            self._speculation = asyncio.create_task(self._speculate_next())
+    
+    async def _speculate_next(self) -> Optional[Tuple[int, np.ndarray, str]]:
+        """Predict the employee's next reply and prepare the follow-up to it"""
+        turns = self.ai_interviewer.get_current_session().turns
+        prediction = await self.ai_interviewer.apredict_next_turn()
+        if prediction is None:
+            return None
+        
+        predicted_reply, follow_up = prediction
+        vectors = await asyncio.to_thread(self.data_manager.embed_texts, [predicted_reply])
+        return turns, vectors[0], follow_up
+    
+    async def _take_speculation(self, message: str) -> Optional[str]:
+        """
+        Claim the drafted follow-up if the employee replied as predicted
+        
+        The draft is discarded either way, and never waited for: if it is still
+        running, the message goes to the model as usual.
+        
+        Args:
+            message: The employee's actual reply
+            
+        Returns:
+            The drafted follow-up, or None if there is no matching draft
+        """
+        task, self._speculation = self._speculation, None
+        if task is None or task.cancelled():
+            return None
+        if not task.done():
+            task.cancel()
+            return None
+        
+        try:
+            speculation = task.result()
+            if speculation is None:
+                return None
+            
+            turns, predicted, follow_up = speculation
+            if turns != self.ai_interviewer.get_current_session().turns:
+                return None
+            
+            vectors = await asyncio.to_thread(self.data_manager.embed_texts, [message])
+            similarity = float(predicted @ vectors[0])
+        except Exception as e:
+            logger.warning(f"Discarding speculative draft: {e}")
+            return None
+        
+        logger.info(f"Speculative draft similarity: {similarity:.3f}")
+        return follow_up if similarity >= Config.SPECULATIVE_MATCH_THRESHOLD else None
+    
+    async def run_interview_scenarios(self, topic: str, scenarios: List[List[str]]) -> List[str]:
+        """
+        Run several scripted interviews concurrently and save them
+        
+        Each scenario gets its own interviewer session sharing this facilitator's
+        model client; at most Config.MAX_CONCURRENCY interviews are in flight.
+        
+        Args:
+            topic: The alignment topic for the interviews
+            scenarios: One list of employee answers per interview
+            
+        Returns:
+            Paths to the saved interview files, in scenario order
+        """
+        if self.is_demo_mode:
+            raise RuntimeError("Interviews require an OPENAI_API_KEY")
+        
+        topic = topic.strip()
+        if not topic:
+            raise ValueError("Topic cannot be empty")
+        
+        semaphore = asyncio.Semaphore(Config.MAX_CONCURRENCY)
+        sessions = await asyncio.gather(
+            *[self._run_scenario(topic, answers, semaphore) for answers in scenarios]
+        )
+        saved_files = await asyncio.to_thread(self.data_manager.save_interview_sessions, list(sessions))
+        
+        logger.info(f"Saved {len(saved_files)} concurrent interviews for topic: {topic}")
+        return saved_files
+    
+    async def _run_scenario(self, topic: str, answers: List[str], semaphore: asyncio.Semaphore) -> InterviewSession:
+        """Conduct one scripted interview on its own interviewer and return the ended session"""
+        from ai_interviewer import AIInterviewer
+        
+        async with semaphore:
+            interviewer = AIInterviewer(llm=self.ai_interviewer.llm)
+            try:
+                interviewer.start_session(topic)
+                for answer in answers:
+                    if interviewer.get_current_session().is_complete():
+                        break
+                    async for _ in interviewer.aconduct_interview(answer):
+                        pass
+                
+                return interviewer.end_session()
+            finally:
+                interviewer.close()
+    
+    async def agenerate_alignment_report(self, topic: Optional[str] = None) -> str:
+        """
+        Async counterpart of generate_alignment_report
+        
+        Args:
+            topic: Optional topic filter for the report
+            
+        Returns:
+            Generated report as markdown text
+        """
+        # The summarize chain is synchronous; run it off the event loop
+        return await asyncio.to_thread(self.generate_alignment_report, topic)
+    
+    def batch_interviews(self, topic: str, scenarios: List[List[str]]) -> List[str]:
+        """
+        Run several scripted interviews with one batched LLM request and save them
+        
+        Args:
+            topic: The alignment topic for the interviews
+            scenarios: One list of employee answers per interview
+            
+        Returns:
+            Paths to the saved interview files
+        """
+        if self.is_demo_mode:
+            raise RuntimeError("Batch interviews require an OPENAI_API_KEY")
+        
+        topic = topic.strip()
+        if not topic:
+            raise ValueError("Topic cannot be empty")
+        
+        followups = self.ai_interviewer.batch_conduct(scenarios, topic=topic)
+        initial_question = self.ai_interviewer.generate_initial_question(topic)
+        
+        sessions = []
+        for answers, replies in zip(scenarios, followups):
+            session = InterviewSession(topic=topic, max_turns=Config.MAX_INTERVIEW_TURNS)
+            session.add_turn(ConversationRole.ASSISTANT, initial_question)
+            
+            for answer, reply in zip(answers, replies):
+                if session.is_complete():
+                    break
+                session.add_turn(ConversationRole.USER, answer)
+                session.add_turn(ConversationRole.ASSISTANT, reply)
+            
+            sessions.append(session)
+        
+        saved_files = self.data_manager.save_interview_sessions(sessions)
+        logger.info(f"Saved {len(saved_files)} batched interviews for topic: {topic}")
+        return saved_files
+    
     def end_session(self) -> str:
         """
         End the current alignment session
@@ -101,12 +435,16 @@ class CompanyAlignmentFacilitator:
             Success message
         """
         try:
+            if self._speculation is not None:
+                self._speculation.cancel()
+                self._speculation = None
+            
             # End the AI interview session
             session = self.ai_interviewer.end_session()
             
-            # Save the session if it exists
-            if session:
-                self._save_current_session()
+            # Completed sessions were saved when they completed; save the rest now
+            if session and not session.is_complete():
+                self._save_current_session(session)
             
             logger.info("Alignment session ended")
             return "Alignment session ended. All data has been saved."
@@ -115,25 +453,44 @@ class CompanyAlignmentFacilitator:
             logger.error(f"Error ending session: {e}")
             return f"Error ending session: {str(e)}"
     
-    def generate_alignment_report(self, topic: Optional[str] = None) -> str:
+    def generate_alignment_report(self, topic: Optional[str] = None, mode: str = "sync") -> str:
         """
         Generate an alignment report
         
         Args:
             topic: Optional topic filter for the report
+            mode: "sync" for immediate generation, or "batch" to summarize the
+                interviews through the OpenAI Batch API at half the cost (blocks
+                until the batch completes, up to 24h)
             
         Returns:
             Generated report as markdown text
         """
+        _check_report_mode(mode)
+        
         if self.is_demo_mode:
             return self._generate_demo_report()
         
         try:
+            self._wait_for_saves()
+            cache_key = self._report_cache_key("align_report", topic=topic)
+            markdown_report = self.cache.get(cache_key)
+            if markdown_report is not None:
+                logger.info(f"Served alignment report for topic: {topic or 'all topics'} from cache")
+                return markdown_report
+            
             # Generate the report
-            report = self.report_generator.generate_alignment_report(topic)
+            if mode == "batch":
+                batch_id = self.report_generator.submit_report_batch(topic)
+                report = self.report_generator.await_batch(
+                    lambda: self.report_generator.collect_report_batch(batch_id, topic)
+                )
+            else:
+                report = self.report_generator.generate_alignment_report(topic)
             
             # Convert to markdown
-            markdown_report = report.to_markdown()
+            markdown_report = report.markdown
+            self.cache.set(cache_key, markdown_report)
             
             logger.info(f"Generated alignment report for topic: {topic or 'all topics'}")
             return markdown_report
@@ -142,6 +499,38 @@ class CompanyAlignmentFacilitator:
             logger.error(f"Error generating report: {e}")
             return f"Error generating alignment report: {str(e)}"
     
+    def submit_report_batch(self, topic: Optional[str] = None) -> str:
+        """
+        Submit an alignment report for offline generation via the OpenAI Batch API
+        
+        Args:
+            topic: Optional topic filter for the report
+            
+        Returns:
+            ID of the created batch
+        """
+        if self.is_demo_mode:
+            raise RuntimeError("Batch reports require an OPENAI_API_KEY")
+        
+        self._wait_for_saves()
+        batch_id = self.report_generator.submit_report_batch(topic)
+        logger.info(f"Submitted report batch {batch_id} for topic: {topic or 'all topics'}")
+        return batch_id
+    
+    def collect_report_batch(self, batch_id: str, topic: Optional[str] = None) -> Optional[str]:
+        """
+        Collect a batch-generated alignment report
+        
+        Args:
+            batch_id: ID returned by submit_report_batch
+            topic: The topic filter the batch was submitted with
+            
+        Returns:
+            Generated report as markdown text, or None if the batch is still running
+        """
+        report = self.report_generator.collect_report_batch(batch_id, topic)
+        return report.markdown if report else None
+    
     def generate_topic_specific_report(self, topic: str) -> str:
         """
         Generate a report focused on a specific topic
@@ -153,8 +542,16 @@ class CompanyAlignmentFacilitator:
             Generated report as markdown text
         """
         try:
+            self._wait_for_saves()
+            cache_key = self._report_cache_key("topic_report", topic=topic)
+            markdown_report = self.cache.get(cache_key)
+            if markdown_report is not None:
+                logger.info(f"Served topic-specific report for: {topic} from cache")
+                return markdown_report
+            
             report = self.report_generator.generate_topic_specific_report(topic)
-            markdown_report = report.to_markdown()
+            markdown_report = report.markdown
+            self.cache.set(cache_key, markdown_report)
             
             logger.info(f"Generated topic-specific report for: {topic}")
             return markdown_report
@@ -163,19 +560,36 @@ class CompanyAlignmentFacilitator:
             logger.error(f"Error generating topic-specific report: {e}")
             return f"Error generating topic-specific report: {str(e)}"
     
-    def generate_comparative_report(self, topics: list) -> str:
+    def generate_comparative_report(self, topics: list, mode: str = "sync") -> str:
         """
         Generate a comparative report between different topics
         
         Args:
             topics: List of topics to compare
+            mode: "sync" or "batch", as for generate_alignment_report
             
         Returns:
             Generated comparative report as markdown text
         """
+        _check_report_mode(mode)
+        
         try:
-            report = self.report_generator.generate_comparative_report(topics)
-            markdown_report = report.to_markdown()
+            self._wait_for_saves()
+            cache_key = self._report_cache_key("comparative_report", topics=sorted(topics))
+            markdown_report = self.cache.get(cache_key)
+            if markdown_report is not None:
+                logger.info(f"Served comparative report for topics: {topics} from cache")
+                return markdown_report
+            
+            if mode == "batch":
+                batch_id = self.report_generator.submit_comparative_batch(topics)
+                report = self.report_generator.await_batch(
+                    lambda: self.report_generator.collect_comparative_batch(batch_id, topics)
+                )
+            else:
+                report = self.report_generator.generate_comparative_report(topics)
+            markdown_report = report.markdown
+            self.cache.set(cache_key, markdown_report)
             
             logger.info(f"Generated comparative report for topics: {topics}")
             return markdown_report
@@ -184,6 +598,15 @@ class CompanyAlignmentFacilitator:
             logger.error(f"Error generating comparative report: {e}")
             return f"Error generating comparative report: {str(e)}"
     
+    def _report_cache_key(self, kind: str, **inputs) -> str:
+        """Build the report cache key from the report inputs and the saved sessions"""
+        return LLMCache.make_key({
+            "kind": kind,
+            "model": Config.REPORT_MODEL,
+            "session_ids": self.data_manager.list_session_ids(),
+            **inputs
+        })
+    
     def get_current_session(self) -> Optional[InterviewSession]:
         """
         Get the current interview session
@@ -214,12 +637,15 @@ class CompanyAlignmentFacilitator:
             Dictionary with system statistics
         """
         try:
+            self._wait_for_saves()
             stats = self.data_manager.get_statistics()
             
             if not self.is_demo_mode:
+                from circuit_breaker import OPENAI_CIRCUIT_BREAKER
+                
                 report_stats = self.report_generator.get_report_statistics()
                 # Combine statistics
-                combined_stats = {**stats, **report_stats}
+                combined_stats = {**stats, **report_stats, **OPENAI_CIRCUIT_BREAKER.get_statistics()}
             else:
                 # Demo mode statistics
                 combined_stats = {
@@ -229,6 +655,9 @@ class CompanyAlignmentFacilitator:
                     "ai_features_available": False
                 }
             
+            # Hit and miss counts of every cache layer are reported here only
+            combined_stats["cache"] = self.get_cache_statistics()
+            
             # Add session status
             combined_stats["session_active"] = self.is_session_active()
             if self.is_session_active():
@@ -247,15 +676,49 @@ class CompanyAlignmentFacilitator:
                 "error": str(e)
             }
     
-    def _save_current_session(self) -> Optional[str]:
+    def get_cache_statistics(self) -> dict:
+        """
+        Get hit and miss counts of every cache layer
+        
+        A layer whose hit rate drops to zero after a change has stopped
+        matching its keys.
+        
+        Returns:
+            Dictionary of {"hits", "misses"} per cache layer
+        """
+        stats = {
+            "report": self.cache.get_statistics(),
+            "session_parse": self.data_manager.get_cache_statistics()
+        }
+        if not self.is_demo_mode:
+            stats["map_summary"] = self.report_generator.map_cache.get_statistics()
+            stats["reduce_summary"] = self.report_generator.reduce_cache.get_statistics()
+            response_stats = self.ai_interviewer.get_cache_statistics()
+            if response_stats:
+                stats["response"] = response_stats
+        return stats
+    
+    def _journal_last_turn(self) -> None:
+        """Append the latest user message and reply to the current session's journal"""
+        try:
+            session = self.ai_interviewer.get_current_session()
+            self.data_manager.append_turns(session, session.conversation[-2:])
+        except Exception as e:
+            # The journal only guards against crashes; the interview goes on without it
+            logger.warning(f"Could not journal interview turn: {e}")
+    
+    def _save_current_session(self, session: Optional[InterviewSession] = None) -> Optional[str]:
         """
         Save the current interview session
         
+        Args:
+            session: Session to save instead of the current one, e.g. one just ended
+        
         Returns:
             Path to saved file or None if no session to save
         """
         try:
-            session = self.ai_interviewer.get_current_session()
+            session = session or self.ai_interviewer.get_current_session()
             if session and session.conversation:
                 filepath = self.data_manager.save_interview_session(session)
                 logger.info(f"Saved current session to {filepath}")
@@ -266,12 +729,53 @@ class CompanyAlignmentFacilitator:
             logger.error(f"Error saving current session: {e}")
             return None
     
+    def _save_in_background(self) -> None:
+        """Queue the current session to be saved without delaying the interview reply"""
+        session = self.ai_interviewer.get_current_session()
+        with self._pending_lock:
+            self._pending_saves.append(session)
+            # A queued flush that has not started yet will pick this session up too
+            if len(self._pending_saves) > 1:
+                return
+        try:
+            self._writer.submit(self._flush_saves)
+        except RuntimeError:
+            # The writer is shut down after cleanup; save on this thread rather than lose the session
+            self._flush_saves()
+    
+    def _flush_saves(self) -> None:
+        """Save every queued session in one batch"""
+        with self._pending_lock:
+            sessions, self._pending_saves = self._pending_saves, []
+        
+        try:
+            filepaths = self.data_manager.save_interview_sessions(sessions)
+            logger.info(f"Saved {len(filepaths)} completed sessions")
+        except Exception as e:
+            logger.error(f"Error saving completed sessions: {e}")
+    
+    def _wait_for_saves(self) -> None:
+        """Block until every queued session save has finished"""
+        try:
+            self._writer.submit(lambda: None).result()
+        except RuntimeError:
+            # After cleanup, sessions are saved synchronously, so none are queued
+            pass
+    
     def cleanup(self) -> None:
         """Cleanup resources"""
         try:
             # End any active session
             if self.is_session_active():
                 self.end_session()
+            self._wait_for_saves()
+            self._writer.shutdown(wait=True)
+            logger.info(f"Cache statistics: {self.get_cache_statistics()}")
+            
+            # Close the pooled HTTP client if the async context was never exited
+            if self._http is not None:
+                asyncio.run(self._http.aclose())
+                self._http = None
             
             logger.info("Facilitator cleanup completed")
             
@@ -280,41 +784,4 @@ class CompanyAlignmentFacilitator:
     
     def _generate_demo_report(self) -> str:
         """Generate a demo report for demonstration purposes"""
-        return """# Company Alignment Facilitator - Demo Report
-
-## 🔑 Demo Mode Active
-
-This is a demonstration of what an alignment report would look like. To generate real reports with actual interview data, please:
-
-1. **Set your OpenAI API key**: `export OPENAI_API_KEY="your-api-key-here"`
-2. **Restart the application**: The AI interviewer will then be available
-3. **Conduct interviews**: Use the Employee Interview tab to gather responses
-4. **Generate real reports**: Click this button again for AI-powered analysis
-
-## Sample Report Structure
-
-### Executive Summary
-When you have real interview data, this section will contain an AI-generated summary of all the key themes, consensus areas, and misalignments discovered across your team interviews.
-
-### Analysis Details
-- **Total Interviews Analyzed**: 0 (Demo Mode)
-- **Alignment Topic**: No active session
-- **Report Generated**: Demo Mode
-
-### Key Features Available with API Key
-
-✅ **AI-Powered Interviews**: Contextual follow-up questions  
-✅ **Automatic Transcription**: Complete conversation logging  
-✅ **Intelligent Analysis**: Pattern recognition across responses  
-✅ **Actionable Insights**: Specific recommendations for alignment  
-
-### Getting Started
-
-1. **Get OpenAI API Key**: Visit [platform.openai.com/api-keys](https://platform.openai.com/api-keys)
-2. **Set Environment Variable**: `export OPENAI_API_KEY="sk-..."`
-3. **Restart Application**: `python main.py`
-4. **Start First Session**: Enter a topic and begin interviewing team members
-
----
-*This is a demo report. Real reports will contain AI-generated insights from your actual team interviews.*
-""" 
\ No newline at end of file
+        return _DEMO_REPORT
\ No newline at end of file
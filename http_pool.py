@@ -0,0 +1,42 @@
+"""
+HTTP Pool module for Company Alignment Facilitator
+
+This module holds the HTTP client shared by every synchronous OpenAI client in
+the process, so interview turns, summarization calls and embedding requests
+reuse the same keep-alive connections instead of each handshaking its own.
+Async clients are bound to the event loop they first run on, so those are
+created per scope (an async facilitator context, a comparative report) with
+the same limits instead.
+"""
+
+import functools
+import httpx
+
+from config import Config
+
+def _limits() -> httpx.Limits:
+    """Get the connection pool limits shared by all OpenAI HTTP clients"""
+    return httpx.Limits(max_connections=Config.MAX_CONN, max_keepalive_connections=Config.MAX_CONN)
+
+def _timeout() -> httpx.Timeout:
+    """Get the timeouts shared by all OpenAI HTTP clients"""
+    return httpx.Timeout(Config.OPENAI_REQUEST_TIMEOUT, connect=5.0)
+
+@functools.lru_cache(maxsize=None)
+def get_http_client() -> httpx.Client:
+    """
+    Get the process-wide HTTP client for OpenAI requests, creating it on first use
+    
+    Returns:
+        HTTP client pooling up to Config.MAX_CONN connections
+    """
+    return httpx.Client(limits=_limits(), timeout=_timeout())
+
+def new_async_http_client() -> httpx.AsyncClient:
+    """
+    Create a pooled async HTTP client for OpenAI requests; the caller closes it
+    
+    Returns:
+        Async HTTP client pooling up to Config.MAX_CONN connections
+    """
+    return httpx.AsyncClient(limits=_limits(), timeout=_timeout())
\ No newline at end of file
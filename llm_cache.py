@@ -0,0 +1,222 @@
+"""
+LLM Cache module for Company Alignment Facilitator
+
+This module provides an exact-match cache for LLM results with pluggable
+storage backends, so identical report requests and interview turns don't
+re-run the model.
+"""
+
+import os
+import time
+import tempfile
+import hashlib
+import logging
+import orjson
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional, Protocol, Tuple
+
+logger = logging.getLogger(__name__)
+
+# A cached value and the time it was stored
+CacheEntry = Tuple[str, float]
+
+class CacheBackend(Protocol):
+    """Storage for cache entries keyed by hex digest"""
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get the entry for a key, or None if missing"""
+        ...
+    
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store the entry for a key"""
+        ...
+    
+    def delete(self, key: str) -> None:
+        """Remove the entry for a key if present"""
+        ...
+
+class MemoryBackend:
+    """In-process LRU backend"""
+    
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get the entry for a key and mark it as recently used"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+    
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store the entry, evicting the least recently used one when full"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def delete(self, key: str) -> None:
+        """Remove the entry for a key if present"""
+        self._entries.pop(key, None)
+
+class DiskBackend:
+    """Backend storing one JSON file per entry, shared across processes"""
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+    
+    def _path(self, key: str) -> str:
+        """Get the file path for a key"""
+        return os.path.join(self.directory, f"{key}.json")
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Read the entry for a key from disk"""
+        try:
+            with open(self._path(key), "rb") as f:
+                data = orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except orjson.JSONDecodeError:
+            logger.warning(f"Ignoring corrupt cache entry {key}")
+            return None
+        return data["value"], data["created_at"]
+    
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Write the entry for a key; the rename keeps readers from seeing partial files"""
+        value, created_at = entry
+        # A temp file of its own per write, so concurrent writers of one key never share one
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f"{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps({"value": value, "created_at": created_at}))
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    
+    def delete(self, key: str) -> None:
+        """Remove the entry file for a key if present"""
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+class SQLiteBackend:
+    """Backend storing entries in one SQLite database, shared across processes"""
+    
+    def __init__(self, db_path: str, max_age_seconds: Optional[float] = None):
+        """
+        Open the database, creating its table if needed
+        
+        Args:
+            db_path: Path of the SQLite database file
+            max_age_seconds: Optional age past which entries are deleted on open,
+                so expired entries don't accumulate in the file
+        """
+        # One connection shared by the threads of async and background calls
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache "
+                "(key TEXT PRIMARY KEY, value TEXT, created_at REAL)"
+            )
+            if max_age_seconds is not None:
+                self._conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (time.time() - max_age_seconds,))
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Read the entry for a key from the database"""
+        with self._lock:
+            row = self._conn.execute("SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+        return None if row is None else (row[0], row[1])
+    
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store the entry for a key"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at) VALUES (?, ?, ?)",
+                (key, *entry)
+            )
+    
+    def delete(self, key: str) -> None:
+        """Remove the entry for a key if present"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+    
+    def close(self) -> None:
+        """Close the database"""
+        self._conn.close()
+
+class TieredBackend:
+    """Backend serving from a fast front backend and falling back to a slower shared one"""
+    
+    def __init__(self, front: CacheBackend, back: CacheBackend):
+        self.front = front
+        self.back = back
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get the entry from the front, promoting it there on a back hit"""
+        entry = self.front.get(key)
+        if entry is None:
+            entry = self.back.get(key)
+            if entry is not None:
+                self.front.set(key, entry)
+        return entry
+    
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store the entry in both backends"""
+        self.front.set(key, entry)
+        self.back.set(key, entry)
+    
+    def delete(self, key: str) -> None:
+        """Remove the entry from both backends"""
+        self.front.delete(key)
+        self.back.delete(key)
+
+class LLMCache:
+    """Exact-match cache for LLM results with a time-to-live"""
+    
+    def __init__(self, backend: CacheBackend, ttl_seconds: int):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(payload: dict) -> str:
+        """
+        Build the cache key for a request
+        
+        Args:
+            payload: Everything the result depends on (model, prompt inputs, ...)
+        
+        Returns:
+            SHA-256 hex digest of the canonical JSON payload
+        """
+        return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached value, or None if missing or expired"""
+        entry = self.backend.get(key)
+        if entry is not None and time.time() - entry[1] > self.ttl_seconds:
+            self.backend.delete(key)
+            entry = None
+        
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return entry[0]
+    
+    def set(self, key: str, value: str) -> None:
+        """Store a value"""
+        self.backend.set(key, (value, time.time()))
+    
+    def get_statistics(self) -> dict:
+        """Get hit and miss counts"""
+        return {"hits": self.hits, "misses": self.misses}
\ No newline at end of file
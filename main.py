@@ -8,11 +8,13 @@ initializing all components and launching the user interface.
 
 import logging
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from config import Config
 from facilitator import CompanyAlignmentFacilitator
-from ui_interface import UIManager
+
+if TYPE_CHECKING:
+    from ui_interface import UIManager
 
 # Configure logging
 logging.basicConfig(
@@ -46,7 +48,7 @@ def initialize_facilitator() -> Optional[CompanyAlignmentFacilitator]:
         print(f"Initialization error: {e}")
         return None
 
-def create_ui_manager(facilitator: CompanyAlignmentFacilitator) -> UIManager:
+def create_ui_manager(facilitator: CompanyAlignmentFacilitator) -> "UIManager":
     """
     Create the UI manager
     
@@ -58,6 +60,9 @@ def create_ui_manager(facilitator: CompanyAlignmentFacilitator) -> UIManager:
     """
     try:
         logger.info("Creating UI manager...")
+        # Imported here so gradio only loads once the UI is actually launched
+        from ui_interface import UIManager
+        
         ui_manager = UIManager(facilitator)
         ui_manager.create_interface()
         logger.info("✅ UI manager created successfully")
@@ -4,6 +4,8 @@ Data models for Company Alignment Facilitator
 This module defines the data structures and types used throughout the application.
 """
 
+import uuid
+import functools
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
@@ -21,22 +23,30 @@ class ConversationTurn:
     content: str
     timestamp: datetime = field(default_factory=datetime.now)
     
+    @functools.cached_property
+    def timestamp_iso(self) -> str:
+        """The timestamp in ISO format; formatted once, as a turn is journaled and then saved"""
+        return self.timestamp.isoformat()
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
         return {
             "role": self.role.value,
             "content": self.content,
-            "timestamp": self.timestamp.isoformat()
+            "timestamp": self.timestamp_iso
         }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ConversationTurn':
         """Create from dictionary"""
-        return cls(
+        turn = cls(
             role=ConversationRole(data["role"]),
             content=data["content"],
             timestamp=datetime.fromisoformat(data["timestamp"])
         )
+        # Re-saving a loaded turn writes back the stored string instead of reformatting it
+        turn.timestamp_iso = data["timestamp"]
+        return turn
 
 @dataclass
 class InterviewSession:
@@ -47,6 +57,7 @@ class InterviewSession:
     max_turns: int = 5
     is_active: bool = False
     created_at: datetime = field(default_factory=datetime.now)
+    session_id: str = field(default_factory=lambda: uuid.uuid4().hex)
     
     def add_turn(self, role: ConversationRole, content: str) -> None:
         """Add a new turn to the conversation"""
@@ -55,6 +66,11 @@ class InterviewSession:
         if role == ConversationRole.ASSISTANT:
             self.turns += 1
     
+    @functools.cached_property
+    def created_at_iso(self) -> str:
+        """The creation time in ISO format; formatted once for saves and report chunks alike"""
+        return self.created_at.isoformat()
+    
     def is_complete(self) -> bool:
         """Check if the interview is complete"""
         return self.turns >= self.max_turns
@@ -67,7 +83,8 @@ class InterviewSession:
             "turns": self.turns,
             "max_turns": self.max_turns,
             "is_active": self.is_active,
-            "created_at": self.created_at.isoformat()
+            "created_at": self.created_at_iso,
+            "session_id": self.session_id
         }
     
     @classmethod
@@ -80,6 +97,10 @@ class InterviewSession:
             is_active=data.get("is_active", False),
             created_at=datetime.fromisoformat(data["created_at"])
         )
+        session.created_at_iso = data["created_at"]
+        # Files saved before session IDs existed keep the generated one
+        if "session_id" in data:
+            session.session_id = data["session_id"]
         session.conversation = [
             ConversationTurn.from_dict(turn_data) 
             for turn_data in data["conversation"]
@@ -98,6 +119,11 @@ class AlignmentReport:
     
     def to_markdown(self) -> str:
         """Convert to markdown format"""
+        return self.markdown
+    
+    @functools.cached_property
+    def markdown(self) -> str:
+        """The report rendered as markdown; rendered once per report"""
         return f"""# Company Alignment Report
 
 ## Executive Summary
@@ -5,9 +5,15 @@ This module handles AI-powered analysis and report generation using LangChain
 summarization chains.
 """
 
+import os
+import time
+import asyncio
 import logging
-from typing import List, Optional
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 from langchain_openai import ChatOpenAI
+from langchain.chains import LLMChain, ReduceDocumentsChain
 from langchain.chains.summarize import load_summarize_chain
 from langchain.schema import Document
 from langchain.text_splitter import RecursiveCharacterTextSplitter
@@ -15,23 +21,67 @@ from langchain.text_splitter import RecursiveCharacterTextSplitter
 from config import Config
 from models import InterviewSession, AlignmentReport
 from data_manager import DataManager
+from llm_cache import DiskBackend, LLMCache
+from circuit_breaker import OPENAI_CIRCUIT_BREAKER
+from http_pool import get_http_client, new_async_http_client
+from tokenizer import count_tokens
 
 logger = logging.getLogger(__name__)
 
+# Prompt for topic reports built from the most relevant employee statements
+TOPIC_REPORT_PROMPT = """The following statements were made by employees in alignment interviews and are the ones most relevant to the topic '{topic}':
+
+{quotes}
+
+Write a concise summary of what employees think about '{topic}', covering the main themes, areas of agreement and areas of disagreement."""
+
 class ReportGenerator:
     """Handles AI-powered report generation from interview data"""
     
-    def __init__(self, data_manager: DataManager):
-        """Initialize the report generator"""
+    def __init__(self, data_manager: DataManager, service_tier: Optional[str] = None):
+        """
+        Initialize the report generator
+        
+        Args:
+            data_manager: Source of the interview sessions
+            service_tier: OpenAI service tier for report calls; defaults to Config.OPENAI_SERVICE_TIER
+        """
         self.data_manager = data_manager
-        self.llm = ChatOpenAI(
-            model=Config.OPENAI_MODEL,
-            temperature=Config.OPENAI_TEMPERATURE,
-            api_key=Config.OPENAI_API_KEY
-        )
+        self.service_tier = service_tier or Config.OPENAI_SERVICE_TIER
+        self.llm = self._build_llm(service_tier=self.service_tier)
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=Config.CHUNK_SIZE,
-            chunk_overlap=Config.CHUNK_OVERLAP
+            chunk_overlap=Config.CHUNK_OVERLAP,
+            length_function=self._count_tokens
+        )
+        self.map_cache = LLMCache(
+            DiskBackend(os.path.join(Config.CONVERSATIONS_DIR, ".map_cache")),
+            ttl_seconds=Config.MAP_SUMMARY_CACHE_TTL_SECONDS
+        )
+        # Any report whose filter selects the same sessions combines the same map
+        # summaries, so the combined summary is reused whatever the topic string
+        self.reduce_cache = LLMCache(
+            DiskBackend(os.path.join(Config.CONVERSATIONS_DIR, ".reduce_cache")),
+            ttl_seconds=Config.MAP_SUMMARY_CACHE_TTL_SECONDS
+        )
+        # Per session ID, its chunks and the (conversation length, chunk size,
+        # overlap) they were made with; least recently used first
+        self._chunks: "OrderedDict[str, Tuple[Tuple[int, int, int], List[Document]]]" = OrderedDict()
+    
+    @staticmethod
+    def _build_llm(http_async_client: Optional[Any] = None, service_tier: Optional[str] = None) -> ChatOpenAI:
+        """Build the report model client from the current configuration"""
+        return ChatOpenAI(
+            model=Config.REPORT_MODEL,
+            temperature=Config.OPENAI_TEMPERATURE,
+            api_key=Config.OPENAI_API_KEY,
+            service_tier=service_tier or Config.OPENAI_SERVICE_TIER,
+            http_client=get_http_client(),
+            http_async_client=http_async_client,
+            # Retries timeouts, 429s and 5xx with exponential backoff; flex is unavailable more often
+            timeout=Config.OPENAI_REQUEST_TIMEOUT,
+            max_retries=Config.OPENAI_MAX_RETRIES,
+            callbacks=[OPENAI_CIRCUIT_BREAKER]
         )
     
     def generate_alignment_report(self, topic: Optional[str] = None) -> AlignmentReport:
@@ -45,27 +95,14 @@ class ReportGenerator:
             Generated alignment report
         """
         try:
-            # Load all interview sessions
-            sessions = self.data_manager.load_all_interview_sessions()
-            
-            if not sessions:
-                raise ValueError("No interview transcripts found. Please conduct some interviews first.")
+            sessions = self._load_sessions(topic)
             
-            # Filter by topic if specified
-            if topic:
-                sessions = [s for s in sessions if topic.lower() in s.topic.lower()]
-                if not sessions:
-                    raise ValueError(f"No interviews found for topic: {topic}")
+            # Chunk the transcripts for processing
+            split_docs = list(self._iter_chunks(sessions))
             
-            # Convert sessions to documents for processing
-            documents = self._sessions_to_documents(sessions)
-            
-            if not documents:
+            if not split_docs:
                 raise ValueError("No valid conversation data found")
             
-            # Split documents for processing
-            split_docs = self.text_splitter.split_documents(documents)
-            
             # Create summarization chain
             summary_chain = load_summarize_chain(
                 llm=self.llm,
@@ -73,8 +110,9 @@ class ReportGenerator:
                 verbose=False
             )
             
-            # Generate the summary
-            summary = summary_chain.run(split_docs)
+            # Map each chunk and reduce, reusing results from earlier reports
+            partials = self._map_summaries(summary_chain.llm_chain, summary_chain.document_variable_name, split_docs)
+            summary = self._reduce_summaries(summary_chain.reduce_documents_chain, partials)
             
             # Create the report
             report = AlignmentReport(
@@ -90,40 +128,356 @@ class ReportGenerator:
             logger.error(f"Error generating alignment report: {e}")
             raise
     
-    def _sessions_to_documents(self, sessions: List[InterviewSession]) -> List[Document]:
+    def _map_summaries(self, map_chain: LLMChain, document_variable: str, documents: List[Document]) -> List[str]:
         """
-        Convert interview sessions to LangChain documents
+        Summarize each document, calling the model only for documents not summarized before
         
         Args:
-            sessions: List of interview sessions
+            map_chain: The map step of the summarization chain
+            document_variable: The map prompt's input variable for the document text
+            documents: The split documents to summarize
             
         Returns:
-            List of LangChain documents
+            One summary per document, in order
         """
-        documents = []
+        keys, summaries, missing = self._lookup_map_summaries(map_chain, documents)
+        if missing:
+            # The map calls are independent, so up to MAP_CONCURRENCY run at once
+            results = map_chain.batch(
+                [{document_variable: documents[i].page_content} for i in missing],
+                config={"max_concurrency": Config.MAP_CONCURRENCY}
+            )
+            self._store_map_summaries(map_chain, keys, summaries, missing, results)
         
-        for session in sessions:
-            try:
-                # Convert session to text
-                conversation_text = self.data_manager.get_conversation_text(session)
-                
-                # Create document with metadata
-                document = Document(
-                    page_content=conversation_text,
-                    metadata={
-                        "topic": session.topic,
-                        "turns": session.turns,
-                        "created_at": session.created_at.isoformat()
-                    }
+        logger.info(f"Summarized {len(missing)} of {len(documents)} chunks; the rest came from cache")
+        return summaries
+    
+    async def _amap_summaries(self, map_chain: LLMChain, document_variable: str, documents: List[Document]) -> List[str]:
+        """Async counterpart of _map_summaries"""
+        keys, summaries, missing = self._lookup_map_summaries(map_chain, documents)
+        if missing:
+            results = await map_chain.abatch(
+                [{document_variable: documents[i].page_content} for i in missing],
+                config={"max_concurrency": Config.MAP_CONCURRENCY}
+            )
+            self._store_map_summaries(map_chain, keys, summaries, missing, results)
+        
+        logger.info(f"Summarized {len(missing)} of {len(documents)} chunks; the rest came from cache")
+        return summaries
+    
+    def _reduce_summaries(self, reduce_chain: ReduceDocumentsChain, partials: List[str]) -> str:
+        """
+        Combine map summaries into one, reusing the result of an earlier identical combine
+        
+        Args:
+            reduce_chain: The reduce step of the summarization chain
+            partials: The map summaries, in document order
+            
+        Returns:
+            Combined summary text
+        """
+        # A lone map summary was written with the prompt the combine step would use again
+        if len(partials) == 1:
+            return partials[0]
+        
+        key = self._reduce_cache_key(reduce_chain, partials)
+        summary = self.reduce_cache.get(key)
+        if summary is None:
+            summary = reduce_chain.run([Document(page_content=p) for p in partials])
+            self.reduce_cache.set(key, summary)
+        return summary
+    
+    async def _areduce_summaries(self, reduce_chain: ReduceDocumentsChain, partials: List[str]) -> str:
+        """Async counterpart of _reduce_summaries"""
+        if len(partials) == 1:
+            return partials[0]
+        
+        key = self._reduce_cache_key(reduce_chain, partials)
+        summary = self.reduce_cache.get(key)
+        if summary is None:
+            result = await reduce_chain.ainvoke({"input_documents": [Document(page_content=p) for p in partials]})
+            summary = result["output_text"]
+            self.reduce_cache.set(key, summary)
+        return summary
+    
+    @staticmethod
+    def _reduce_cache_key(reduce_chain: ReduceDocumentsChain, partials: List[str]) -> str:
+        """Build the cache key for combining the given map summaries"""
+        return LLMCache.make_key({
+            "model": Config.REPORT_MODEL,
+            "prompt": reduce_chain.combine_documents_chain.llm_chain.prompt.template,
+            "partials": partials
+        })
+    
+    def _lookup_map_summaries(self, map_chain: LLMChain,
+                              documents: List[Document]) -> Tuple[List[str], List[Optional[str]], List[int]]:
+        """Get the cache keys, the cached summaries and the positions of documents without one"""
+        keys = [
+            LLMCache.make_key({
+                "model": Config.REPORT_MODEL,
+                "prompt": map_chain.prompt.template,
+                "text": document.page_content
+            })
+            for document in documents
+        ]
+        summaries = [self.map_cache.get(key) for key in keys]
+        missing = [i for i, summary in enumerate(summaries) if summary is None]
+        return keys, summaries, missing
+    
+    def _store_map_summaries(self, map_chain: LLMChain, keys: List[str], summaries: List[Optional[str]],
+                             missing: List[int], results: List[dict]) -> None:
+        """Fill in and cache the summaries generated for the missing documents"""
+        for i, result in zip(missing, results):
+            summaries[i] = result[map_chain.output_key]
+            self.map_cache.set(keys[i], summaries[i])
+    
+    def _load_sessions(self, topic: Optional[str] = None) -> List[InterviewSession]:
+        """
+        Load interview sessions, optionally filtered by topic
+        
+        Args:
+            topic: Optional topic filter
+            
+        Returns:
+            Matching interview sessions
+        """
+        if not topic:
+            sessions = self.data_manager.load_all_interview_sessions()
+            if not sessions:
+                raise ValueError("No interview transcripts found. Please conduct some interviews first.")
+            return sessions
+        
+        # Filter on the session index so only matching transcripts are read
+        rows = self.data_manager.load_session_index()
+        if not rows:
+            raise ValueError("No interview transcripts found. Please conduct some interviews first.")
+        
+        needle = topic.lower()
+        session_ids = [row["id"] for row in rows if needle in row["topic"].lower()]
+        sessions = self.data_manager.load_sessions_by_ids(session_ids)
+        if not sessions:
+            raise ValueError(f"No interviews found for topic: {topic}")
+        
+        return sessions
+    
+    def submit_report_batch(self, topic: Optional[str] = None) -> str:
+        """
+        Submit the per-interview summaries of a report to the OpenAI Batch API
+        
+        Args:
+            topic: Optional topic filter for the report
+            
+        Returns:
+            ID of the created batch
+        """
+        sessions = self._load_sessions(topic)
+        return self.data_manager.submit_batch_job(sessions)
+    
+    def collect_report_batch(self, batch_id: str, topic: Optional[str] = None) -> Optional[AlignmentReport]:
+        """
+        Build the alignment report from a completed batch job
+        
+        Args:
+            batch_id: ID returned by submit_report_batch
+            topic: The topic filter the batch was submitted with
+            
+        Returns:
+            Generated alignment report, or None if the batch is still running
+        """
+        try:
+            summaries = self.data_manager.poll_batch(batch_id)
+            if summaries is None:
+                return None
+            
+            if not summaries:
+                raise ValueError(f"Batch {batch_id} returned no summaries")
+            
+            # The batch did the map step; combine the per-interview summaries.
+            # A single summary already answers the combine prompt
+            if len(summaries) == 1:
+                summary = summaries[0]
+            else:
+                combine_chain = load_summarize_chain(
+                    llm=self.llm,
+                    chain_type="stuff",
+                    verbose=False
                 )
-                
-                documents.append(document)
-                
-            except Exception as e:
-                logger.warning(f"Skipping session due to error: {e}")
-                continue
-        
-        return documents
+                summary = combine_chain.run([Document(page_content=s) for s in summaries])
+            
+            report = AlignmentReport(
+                summary=summary,
+                total_interviews=len(summaries),
+                topic=topic or "Various topics"
+            )
+            
+            logger.info(f"Generated alignment report from batch {batch_id}")
+            return report
+            
+        except Exception as e:
+            logger.error(f"Error generating report from batch {batch_id}: {e}")
+            raise
+    
+    def submit_comparative_batch(self, topics: List[str]) -> str:
+        """
+        Submit the per-interview summaries of a comparative report to the OpenAI Batch API
+        
+        Args:
+            topics: List of topics to compare
+            
+        Returns:
+            ID of the created batch
+        """
+        topic_sessions = self._group_sessions_by_topic(topics)
+        
+        # Group indices refer to positions in topics, so collection needs the same list
+        sessions, groups = [], []
+        for topic, matched in topic_sessions.items():
+            sessions.extend(matched)
+            groups.extend([topics.index(topic)] * len(matched))
+        
+        return self.data_manager.submit_batch_job(sessions, groups=groups)
+    
+    def collect_comparative_batch(self, batch_id: str, topics: List[str]) -> Optional[AlignmentReport]:
+        """
+        Build the comparative report from a completed batch job
+        
+        Args:
+            batch_id: ID returned by submit_comparative_batch
+            topics: The topics the batch was submitted with
+            
+        Returns:
+            Comparative alignment report, or None if the batch is still running
+        """
+        try:
+            grouped = self.data_manager.poll_batch_groups(batch_id)
+            if grouped is None:
+                return None
+            
+            if not grouped:
+                raise ValueError(f"Batch {batch_id} returned no summaries")
+            
+            # The batch did the map step; combine each topic's interview summaries
+            combine_chain = load_summarize_chain(
+                llm=self.llm,
+                chain_type="stuff",
+                verbose=False
+            )
+            topic_summaries = {
+                topics[group]: summaries[0] if len(summaries) == 1 else combine_chain.run([Document(page_content=s) for s in summaries])
+                for group, summaries in sorted(grouped.items())
+            }
+            
+            report = AlignmentReport(
+                summary=self._compare_topic_summaries(topic_summaries),
+                total_interviews=sum(len(summaries) for summaries in grouped.values()),
+                topic=f"Comparative analysis: {', '.join(topics)}"
+            )
+            
+            logger.info(f"Generated comparative report from batch {batch_id}")
+            return report
+            
+        except Exception as e:
+            logger.error(f"Error generating comparative report from batch {batch_id}: {e}")
+            raise
+    
+    def await_batch(self, collect: Callable[[], Optional[AlignmentReport]],
+                    poll_seconds: Optional[int] = None) -> AlignmentReport:
+        """
+        Poll a batch until its report is ready
+        
+        Args:
+            collect: Zero-argument call that returns the report, or None while the batch is running
+            poll_seconds: Seconds to wait between status checks; defaults to Config.BATCH_POLL_SECONDS
+            
+        Returns:
+            The generated report
+        """
+        if poll_seconds is None:
+            poll_seconds = Config.BATCH_POLL_SECONDS
+        report = collect()
+        while report is None:
+            logger.info(f"Batch still running, checking again in {poll_seconds}s")
+            time.sleep(poll_seconds)
+            report = collect()
+        return report
+    
+    def _iter_chunks(self, sessions: List[InterviewSession]) -> Iterator[Document]:
+        """
+        Chunk interview transcripts, reusing the chunks of sessions chunked for earlier reports
+        
+        Args:
+            sessions: List of interview sessions
+            
+        Yields:
+            LangChain documents, one per chunk
+        """
+        for session in sessions:
+            # Sessions only grow, so their length and the chunk settings tell whether the chunks are current
+            version = (len(session.conversation), Config.CHUNK_SIZE, Config.CHUNK_OVERLAP)
+            entry = self._chunks.get(session.session_id)
+            if entry is not None and entry[0] == version:
+                chunks = entry[1]
+            else:
+                try:
+                    chunks = list(self._chunk_session(session))
+                except Exception as e:
+                    logger.warning(f"Skipping session due to error: {e}")
+                    continue
+                # Replaces the session's stale chunks; deleted sessions age out
+                self._chunks[session.session_id] = (version, chunks)
+                if len(self._chunks) > Config.CHUNK_CACHE_SESSIONS:
+                    self._chunks.popitem(last=False)
+            self._chunks.move_to_end(session.session_id)
+            yield from chunks
+    
+    def _chunk_session(self, session: InterviewSession) -> Iterator[Document]:
+        """
+        Chunk one interview transcript turn by turn, without building the full transcript first
+        
+        Entries (the topic line and each turn) are packed into chunks of up to
+        CHUNK_SIZE tokens, joined by blank lines as in the conversation text;
+        consecutive chunks repeat trailing entries of up to CHUNK_OVERLAP
+        tokens. Only an entry longer than a chunk goes through the text splitter.
+        
+        Args:
+            session: The interview session
+            
+        Yields:
+            LangChain documents, one per chunk
+        """
+        separator = self._count_tokens("\n\n")
+        metadata = {
+            "topic": session.topic,
+            "turns": session.turns,
+            "created_at": session.created_at_iso
+        }
+        # Entries of the current chunk with their token counts
+        chunk: Deque[Tuple[str, int]] = deque()
+        # Tokens of the chunk's entries joined by "\n\n"
+        size = -separator
+        
+        for entry in self.data_manager.iter_conversation_entries(session):
+            length = self._count_tokens(entry)
+            if length > Config.CHUNK_SIZE:
+                pieces = [(piece, self._count_tokens(piece)) for piece in self.text_splitter.split_text(entry)]
+            else:
+                pieces = [(entry, length)]
+            
+            for piece, length in pieces:
+                if chunk and size + separator + length > Config.CHUNK_SIZE:
+                    yield Document(page_content="\n\n".join(text for text, _ in chunk), metadata=dict(metadata))
+                    while chunk and (size > Config.CHUNK_OVERLAP or size + separator + length > Config.CHUNK_SIZE):
+                        size -= chunk.popleft()[1] + separator
+                chunk.append((piece, length))
+                size += length + separator
+        
+        if chunk:
+            yield Document(page_content="\n\n".join(text for text, _ in chunk), metadata=dict(metadata))
+    
+    @staticmethod
+    def _count_tokens(text: str) -> int:
+        """Count the tokens of a text with the report model's tokenizer"""
+        return count_tokens(Config.REPORT_MODEL, text)
     
     def generate_topic_specific_report(self, topic: str) -> AlignmentReport:
         """
@@ -135,7 +489,32 @@ class ReportGenerator:
         Returns:
             Topic-specific alignment report
         """
-        return self.generate_alignment_report(topic=topic)
+        # Only the most relevant turns go to the model instead of every transcript
+        try:
+            matches = self.data_manager.search_turns(topic, k=Config.TOPIC_REPORT_TOP_K)
+        except Exception as e:
+            logger.warning(f"Turn search failed, summarizing full transcripts: {e}")
+            matches = []
+        
+        if not matches:
+            return self.generate_alignment_report(topic=topic)
+        
+        try:
+            quotes = "\n".join(f"- [{match['topic']}] {match['content']}" for match in matches)
+            summary = self.llm.invoke(TOPIC_REPORT_PROMPT.format(topic=topic, quotes=quotes)).content
+            
+            report = AlignmentReport(
+                summary=summary,
+                total_interviews=len({match["filepath"] for match in matches}),
+                topic=topic
+            )
+            
+            logger.info(f"Generated topic-specific report from {len(matches)} relevant turns")
+            return report
+            
+        except Exception as e:
+            logger.error(f"Error generating topic-specific report: {e}")
+            raise
     
     def generate_comparative_report(self, topics: List[str]) -> AlignmentReport:
         """
@@ -148,26 +527,32 @@ class ReportGenerator:
             Comparative alignment report
         """
         try:
-            # Load all sessions
-            all_sessions = self.data_manager.load_all_interview_sessions()
-            
-            if not all_sessions:
-                raise ValueError("No interview data available for comparison")
-            
-            # Group sessions by topic
-            topic_sessions = {}
-            for session in all_sessions:
-                for topic in topics:
-                    if topic.lower() in session.topic.lower():
-                        if topic not in topic_sessions:
-                            topic_sessions[topic] = []
-                        topic_sessions[topic].append(session)
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.generate_comparative_report_async(topics))
+        
+        # asyncio.run cannot start inside a running loop (e.g. an async UI handler);
+        # run the report on its own loop in a worker thread instead
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.generate_comparative_report_async(topics)).result()
+    
+    async def generate_comparative_report_async(self, topics: List[str]) -> AlignmentReport:
+        """
+        Async counterpart of generate_comparative_report; topics are summarized concurrently
+        
+        Args:
+            topics: List of topics to compare
             
-            if not topic_sessions:
-                raise ValueError(f"No interviews found for the specified topics: {topics}")
+        Returns:
+            Comparative alignment report
+        """
+        try:
+            topic_sessions = self._group_sessions_by_topic(topics)
             
-            # Generate comparative analysis
-            comparative_summary = self._generate_comparative_summary(topic_sessions)
+            # Generate comparative analysis; all of the report's concurrent calls
+            # share one connection pool, closed with the report's event loop
+            async with new_async_http_client() as http:
+                comparative_summary = await self._generate_comparative_summary(topic_sessions, self._build_llm(http, self.service_tier))
             
             # Create report
             total_interviews = sum(len(sessions) for sessions in topic_sessions.values())
@@ -184,37 +569,122 @@ class ReportGenerator:
             logger.error(f"Error generating comparative report: {e}")
             raise
     
-    def _generate_comparative_summary(self, topic_sessions: dict) -> str:
+    def _group_sessions_by_topic(self, topics: List[str]) -> Dict[str, List[InterviewSession]]:
+        """
+        Load interview sessions and group them by the topics they match
+        
+        Args:
+            topics: List of topics to compare
+            
+        Returns:
+            Dictionary mapping topics to their sessions
+        """
+        rows = self.data_manager.load_session_index()
+        
+        if not rows:
+            raise ValueError("No interview data available for comparison")
+        
+        # Lowercase each topic once rather than per session
+        needles = [(topic, topic.lower()) for topic in topics]
+        
+        # Filter on the session index so only transcripts matching some topic are read
+        session_ids = [
+            row["id"] for row in rows
+            if any(needle in row["topic"].lower() for _, needle in needles)
+        ]
+        matched_sessions = self.data_manager.load_sessions_by_ids(session_ids)
+        
+        # Group sessions by topic
+        topic_sessions = {}
+        for session in matched_sessions:
+            session_topic = session.topic.lower()
+            for topic, needle in needles:
+                if needle in session_topic:
+                    topic_sessions.setdefault(topic, []).append(session)
+        
+        if not topic_sessions:
+            raise ValueError(f"No interviews found for the specified topics: {topics}")
+        
+        return topic_sessions
+    
+    async def _generate_comparative_summary(self, topic_sessions: dict, llm: ChatOpenAI) -> str:
         """
         Generate a comparative summary between different topics
         
         Args:
             topic_sessions: Dictionary mapping topics to their sessions
+            llm: Model client for the summaries
             
         Returns:
             Comparative summary text
         """
         try:
-            # Create documents for each topic
+            # Chunk each topic's transcripts
             topic_documents = {}
             for topic, sessions in topic_sessions.items():
-                documents = self._sessions_to_documents(sessions)
+                documents = list(self._iter_chunks(sessions))
                 if documents:
                     topic_documents[topic] = documents
             
-            # Generate individual summaries for each topic
-            topic_summaries = {}
-            for topic, documents in topic_documents.items():
-                split_docs = self.text_splitter.split_documents(documents)
-                summary_chain = load_summarize_chain(
-                    llm=self.llm,
-                    chain_type="map_reduce",
-                    verbose=False
-                )
-                topic_summaries[topic] = summary_chain.run(split_docs)
+            # The per-topic summaries are independent, so they run concurrently
+            semaphore = asyncio.Semaphore(Config.MAX_CONCURRENCY)
+            summaries = await asyncio.gather(
+                *[self._analyze_topic_async(documents, semaphore, llm) for documents in topic_documents.values()]
+            )
+            topic_summaries = dict(zip(topic_documents, summaries))
+            
+            comparative_summary = await llm.ainvoke(self._comparative_prompt(topic_summaries))
+            return comparative_summary.content
             
+        except Exception as e:
+            logger.error(f"Error generating comparative summary: {e}")
+            raise
+    
+    async def _analyze_topic_async(self, documents: List[Document], semaphore: asyncio.Semaphore,
+                                   llm: ChatOpenAI) -> str:
+        """
+        Summarize one topic's interviews
+        
+        Args:
+            documents: The topic's chunked interview documents
+            semaphore: Bounds the number of topics summarized at once
+            llm: Model client for the summaries
+            
+        Returns:
+            Topic summary text
+        """
+        summary_chain = load_summarize_chain(
+            llm=llm,
+            chain_type="map_reduce",
+            verbose=False
+        )
+        async with semaphore:
+            partials = await self._amap_summaries(summary_chain.llm_chain, summary_chain.document_variable_name, documents)
+            return await self._areduce_summaries(summary_chain.reduce_documents_chain, partials)
+    
+    def _compare_topic_summaries(self, topic_summaries: Dict[str, str]) -> str:
+        """
+        Generate the comparative analysis of per-topic summaries
+        
+        Args:
+            topic_summaries: Dictionary mapping topics to their summaries
+            
+        Returns:
+            Comparative summary text
+        """
+        try:
             # Generate comparative analysis
-            comparative_prompt = f"""
+            comparative_summary = self.llm.invoke(self._comparative_prompt(topic_summaries)).content
+            return comparative_summary
+            
+        except Exception as e:
+            logger.error(f"Error comparing topic summaries: {e}")
+            raise
+    
+    @staticmethod
+    def _comparative_prompt(topic_summaries: Dict[str, str]) -> str:
+        """Build the prompt comparing per-topic summaries"""
+        return f"""
             Analyze the following topic summaries and provide a comparative analysis:
             
             {chr(10).join(f"Topic '{topic}': {summary}" for topic, summary in topic_summaries.items())}
@@ -225,13 +695,6 @@ class ReportGenerator:
             3. Areas of alignment and misalignment
             4. Strategic implications and recommendations
             """
-            
-            comparative_summary = self.llm.predict(comparative_prompt)
-            return comparative_summary
-            
-        except Exception as e:
-            logger.error(f"Error generating comparative summary: {e}")
-            raise
     
     def get_report_statistics(self) -> dict:
         """
@@ -243,16 +706,8 @@ class ReportGenerator:
         try:
             stats = self.data_manager.get_statistics()
             
-            # Add report-specific statistics
-            sessions = self.data_manager.load_all_interview_sessions()
-            if sessions:
-                topics = list(set(s.topic for s in sessions))
-                stats["unique_topics"] = len(topics)
-                stats["topics"] = topics
-            else:
-                stats["unique_topics"] = 0
-                stats["topics"] = []
-            
+            # Topics come deduplicated from the session index, so no session is loaded
+            stats["unique_topics"] = len(stats["topics"])
             return stats
             
         except Exception as e:
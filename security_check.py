@@ -8,64 +8,182 @@ is exposed in the codebase.
 
 import os
 import re
+import mmap
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# Patterns to look for; none can span a newline, so scanning a whole file
+# finds the same lines as scanning it line by line
+CREDENTIAL_PATTERNS = [
+    r'sk-[a-zA-Z0-9]{48}',  # OpenAI API key pattern
+    r'pk_[a-zA-Z0-9]{48}',  # OpenAI public key pattern
+    r'[a-zA-Z0-9]{32,}',    # Generic long strings that might be keys
+    r'password[^\S\n]*=[^\S\n]*["\'][^"\'\n]+["\']',  # Hardcoded passwords
+    r'secret[^\S\n]*=[^\S\n]*["\'][^"\'\n]+["\']',    # Hardcoded secrets
+    r'api_key[^\S\n]*=[^\S\n]*["\'][^"\'\n]+["\']',   # Hardcoded API keys
+]
+
+# Index of the generic long-string pattern, the only one without a literal prefix
+_GENERIC_PATTERN = 2
+
+# Every other pattern needs one of these, so files without any of them only
+# need the generic pattern
+_QUICK_NEEDLES = (b'sk-', b'pk_', b'password', b'secret', b'api_key')
+
+def _compile_patterns(indexes):
+    """
+    Compile credential patterns into one alternation, so each file is scanned
+    in a single pass; compiled for bytes so files can be scanned through mmap
+    
+    Args:
+        indexes: Indexes into CREDENTIAL_PATTERNS
+        
+    Returns:
+        Pattern whose group g<index> names the credential pattern that matched
+    """
+    return re.compile("|".join(f"(?P<g{i}>{CREDENTIAL_PATTERNS[i]})" for i in indexes).encode())
+
+_CREDENTIAL_RE = _compile_patterns(range(len(CREDENTIAL_PATTERNS)))
+_GENERIC_RE = _compile_patterns([_GENERIC_PATTERN])
+
+# Each pattern on its own, to tell which of them match a flagged line
+_PATTERN_RES = [re.compile(pattern.encode()) for pattern in CREDENTIAL_PATTERNS]
+
+# Below this many files, starting worker processes costs more than the scan
+_PARALLEL_MIN_FILES = 64
+
+# Lines containing these are legitimate (like in tests or examples)
+SKIP_MARKERS = ['test-key', 'your-api-key', 'example', 'placeholder']
+
+# All markers in one case-insensitive pattern, so a flagged line is checked in
+# one search without lowercasing a copy of it
+_SKIP_RE = re.compile("|".join(re.escape(marker) for marker in SKIP_MARKERS).encode(), re.IGNORECASE)
+
+def iter_python_files(top='.'):
+    """Yield the Python files under a directory, skipping .git and unreadable directories"""
+    # scandir entries carry their file type, so no file is stat-ed to classify it
+    try:
+        entries = os.scandir(top)
+    except OSError:
+        # Like os.walk, skip what can't be listed rather than abort the scan
+        return
+    
+    with entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                is_python_file = not is_dir and entry.name.endswith('.py') and entry.is_file()
+            except OSError:
+                continue
+            
+            if is_dir:
+                if entry.name != '.git':
+                    yield from iter_python_files(entry.path)
+            elif is_python_file:
+                yield entry.path
+
+def find_credentials(file_path, content):
+    """
+    Find the lines of a file that look like they hold credentials
+    
+    Args:
+        file_path: Path reported in the issues
+        content: The file content as bytes, or an mmap of the file
+        
+    Returns:
+        One issue per flagged line and credential pattern it matches
+    """
+    issues = []
+    line_num = 1
+    counted_to = 0
+    pos = 0
+    
+    # memmem-backed substring searches are far cheaper than the full alternation;
+    # find() rather than `in`, which on an mmap doesn't search for substrings
+    if any(content.find(needle) != -1 for needle in _QUICK_NEEDLES):
+        pattern, indexes = _CREDENTIAL_RE, range(len(CREDENTIAL_PATTERNS))
+    else:
+        pattern, indexes = _GENERIC_RE, [_GENERIC_PATTERN]
+    
+    while True:
+        match = pattern.search(content, pos)
+        if match is None:
+            break
+        
+        line_start = content.rfind(b'\n', 0, match.start()) + 1
+        line_end = content.find(b'\n', match.end())
+        if line_end == -1:
+            line_end = len(content)
+        
+        line = content[line_start:line_end]
+        if _SKIP_RE.search(line) is None:
+            # mmap has no count(), so count over a copy of just the lines since the last hit
+            line_num += content[counted_to:line_start].count(b'\n')
+            counted_to = line_start
+            line_content = line.strip().decode('utf-8', errors='replace')
+            # The alternation only reports the first pattern to match; flagged
+            # lines are rare, so each pattern is checked on its own here
+            for i in indexes:
+                if _PATTERN_RES[i].search(line) is not None:
+                    issues.append({
+                        'file': file_path,
+                        'line': line_num,
+                        'line_content': line_content,
+                        'pattern': CREDENTIAL_PATTERNS[i]
+                    })
+        
+        # The rest of this line is already reported or skipped
+        pos = line_end + 1
+    
+    return issues
+
+def scan_file(file_path):
+    """
+    Scan one file for credentials; module-level so worker processes can run it
+    
+    Args:
+        file_path: Path of the file to scan
+        
+    Returns:
+        The issues found and the read error, if any
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            # An empty file can't be mapped and has nothing to find
+            if os.fstat(f.fileno()).st_size == 0:
+                return [], None
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return find_credentials(file_path, content), None
+    except Exception as e:
+        return [], e
+
 def check_for_hardcoded_credentials():
     """Check for hardcoded API keys, passwords, or other credentials"""
     print("🔍 Checking for hardcoded credentials...")
     
-    # Patterns to look for
-    patterns = [
-        r'sk-[a-zA-Z0-9]{48}',  # OpenAI API key pattern
-        r'pk_[a-zA-Z0-9]{48}',  # OpenAI public key pattern
-        r'[a-zA-Z0-9]{32,}',    # Generic long strings that might be keys
-        r'password\s*=\s*["\'][^"\']+["\']',  # Hardcoded passwords
-        r'secret\s*=\s*["\'][^"\']+["\']',    # Hardcoded secrets
-        r'api_key\s*=\s*["\'][^"\']+["\']',   # Hardcoded API keys
-    ]
-    
-    # Files to check (Python files only)
-    python_files = []
-    for root, dirs, files in os.walk('.'):
-        # Skip .git directory
-        if '.git' in dirs:
-            dirs.remove('.git')
-        
-        for file in files:
-            if file.endswith('.py'):
-                python_files.append(os.path.join(root, file))
+    python_files = list(iter_python_files())
+    if len(python_files) >= _PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(scan_file, python_files, chunksize=16))
+    else:
+        results = [scan_file(file_path) for file_path in python_files]
     
     issues_found = []
-    
-    for file_path in python_files:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
-                
-                for line_num, line in enumerate(lines, 1):
-                    for pattern in patterns:
-                        if re.search(pattern, line):
-                            # Skip legitimate patterns (like in tests or examples)
-                            if any(skip in line.lower() for skip in ['test-key', 'your-api-key', 'example', 'placeholder']):
-                                continue
-                            
-                            issues_found.append({
-                                'file': file_path,
-                                'line': line_num,
-                                'line_content': line.strip(),
-                                'pattern': pattern
-                            })
-        except Exception as e:
-            print(f"⚠️  Could not read {file_path}: {e}")
+    for file_path, (issues, error) in zip(python_files, results):
+        if error is not None:
+            print(f"⚠️  Could not read {file_path}: {error}")
+        issues_found.extend(issues)
     
     if issues_found:
-        print("❌ Potential security issues found:")
+        # One write for the whole listing rather than three prints per issue
+        report_lines = ["❌ Potential security issues found:"]
         for issue in issues_found:
-            print(f"   File: {issue['file']}:{issue['line']}")
-            print(f"   Content: {issue['line_content']}")
-            print()
+            report_lines.append(f"   File: {issue['file']}:{issue['line']}")
+            report_lines.append(f"   Content: {issue['line_content']}")
+            report_lines.append("")
+        print("\n".join(report_lines))
         return False
     else:
         print("✅ No hardcoded credentials found")
@@ -107,10 +225,11 @@ def check_sensitive_files():
             found_sensitive.append(file)
     
     if found_sensitive:
-        print("⚠️  Found potentially sensitive files:")
-        for file in found_sensitive:
-            print(f"   - {file}")
-        print("   Make sure these files are in .gitignore")
+        print("\n".join([
+            "⚠️  Found potentially sensitive files:",
+            *(f"   - {file}" for file in found_sensitive),
+            "   Make sure these files are in .gitignore"
+        ]))
     else:
         print("✅ No sensitive files found")
     
@@ -141,9 +260,7 @@ def check_gitignore():
             missing_patterns.append(pattern)
     
     if missing_patterns:
-        print("❌ Missing patterns in .gitignore:")
-        for pattern in missing_patterns:
-            print(f"   - {pattern}")
+        print("\n".join(["❌ Missing patterns in .gitignore:", *(f"   - {pattern}" for pattern in missing_patterns)]))
         return False
     else:
         print("✅ .gitignore properly configured")
@@ -0,0 +1,33 @@
+"""
+Tokenizer module for Company Alignment Facilitator
+
+This module loads each model's tiktoken encoding once per process, so the
+interview context budget and report chunking count tokens without rebuilding
+BPE state.
+"""
+
+import functools
+import tiktoken
+
+@functools.lru_cache(maxsize=None)
+def get_encoding(model: str) -> tiktoken.Encoding:
+    """Load the tokenizer for a model once; unknown models use the current default encoding"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+def count_tokens(model: str, text: str) -> int:
+    """
+    Count the tokens of a text with a model's tokenizer
+    
+    Args:
+        model: The model whose encoding to use
+        text: The text to count
+    
+    Returns:
+        Number of tokens
+    """
+    # encode_ordinary skips the special-token scan, and won't raise on
+    # "<|endoftext|>" typed into an interview
+    return len(get_encoding(model).encode_ordinary(text))
\ No newline at end of file
@@ -5,11 +5,23 @@ This module handles all Gradio-related functionality and user interface componen
 """
 
 import gradio as gr
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
 
 from facilitator import CompanyAlignmentFacilitator
 from config import Config
 
+INTERVIEW_COMPLETE_MESSAGE = "Interview complete! Thank you for your participation."
+
+DEMO_MODE_MARKDOWN = """
+## 🔑 Demo Mode Active
+
+**You're running in demo mode** - Set your `OPENAI_API_KEY` environment variable and restart to enable full AI features.
+
+You can still explore the interface and see example reports!
+"""
+
+INTRO_MARKDOWN = "An AI-powered tool for conducting alignment interviews and generating comprehensive reports."
+
 class UIManager:
     """Manages the Gradio user interface"""
     
@@ -17,24 +29,24 @@ class UIManager:
         """Initialize the UI manager"""
         self.facilitator = facilitator
         self.demo = None
+        # Built interfaces by demo mode, so re-creating one reuses its component tree
+        self._interface_cache = {}
     
     def create_interface(self) -> gr.Blocks:
-        """Create the Gradio interface"""
+        """Create the Gradio interface, reusing the one already built for this mode"""
+        cached = self._interface_cache.get(self.facilitator.is_demo_mode)
+        if cached is not None:
+            self.demo = cached
+            return cached
         
         with gr.Blocks(title="Company Alignment Facilitator", theme=gr.themes.Soft()) as demo:
             gr.Markdown("# 🎯 Company Alignment Facilitator")
             
             # Show demo mode warning if applicable
             if self.facilitator.is_demo_mode:
-                gr.Markdown("""
-                ## 🔑 Demo Mode Active
-                
-                **You're running in demo mode** - Set your `OPENAI_API_KEY` environment variable and restart to enable full AI features.
-                
-                You can still explore the interface and see example reports!
-                """)
+                gr.Markdown(DEMO_MODE_MARKDOWN)
             else:
-                gr.Markdown("An AI-powered tool for conducting alignment interviews and generating comprehensive reports.")
+                gr.Markdown(INTRO_MARKDOWN)
             
             with gr.Tabs():
                 # Tab 1: Admin & Reporting
@@ -49,6 +61,7 @@ class UIManager:
                 with gr.Tab("Statistics & Analytics"):
                     self._create_statistics_tab()
             
+            self._interface_cache[self.facilitator.is_demo_mode] = demo
             self.demo = demo
             return demo
     
@@ -195,26 +208,33 @@ class UIManager:
         if not topics.strip():
             return "Please enter topics to compare (comma-separated)."
         
-        topic_list = [t.strip() for t in topics.split(",") if t.strip()]
+        topic_list = list(filter(None, map(str.strip, topics.split(","))))
         if len(topic_list) < 2:
             return "Please enter at least 2 topics to compare."
         
         return self.facilitator.generate_comparative_report(topic_list)
     
-    def _interview_chat(self, message: str, history: List[List[str]]) -> Tuple[str, List[List[str]], str]:
-        """Handle interview chat interface"""
+    def _interview_chat(self, message: str, history: List[List[str]]) -> Iterator[Tuple[str, List[List[str]], str]]:
+        """Handle interview chat interface, showing the reply as it is generated"""
         if not self.facilitator.is_session_active():
-            return "", history, "Please start an alignment session first."
-        
-        ai_response, is_complete, error = self.facilitator.conduct_interview(message)
+            yield "", history, "Please start an alignment session first."
+            return
         
-        if error:
-            return "", history, error
+        if self.facilitator.get_current_session().is_complete():
+            yield "", history, INTERVIEW_COMPLETE_MESSAGE
+            return
         
-        if is_complete:
-            return "", history, "Interview complete! Thank you for your participation."
+        ai_response = ""
+        try:
+            for chunk in self.facilitator.conduct_interview_stream(message):
+                ai_response += chunk
+                yield ai_response, history, ""
+        except Exception as e:
+            yield "", history, f"An error occurred: {str(e)}"
+            return
         
-        return ai_response, history, ""
+        if self.facilitator.get_current_session().is_complete():
+            yield ai_response, history, INTERVIEW_COMPLETE_MESSAGE
     
     def _get_statistics(self) -> Tuple[dict, str]:
         """Get system statistics and status"""